@@ -87,9 +87,7 @@ def apply_toolkit_transformations(image, **transforms):
         if target_format.upper() == "JPEG":
             if result.mode in ("RGBA", "LA"):
                 background = Image.new("RGB", result.size, (255, 255, 255))
-                background.paste(
-                    result, mask=result.split()[-1] if result.mode == "RGBA" else None
-                )
+                background.paste(result, mask=result if result.mode == "RGBA" else None)
                 result = background
 
         result.save(buffer, format=target_format)
@@ -83,7 +83,7 @@ def process_image_folder(
                 if image.mode == "RGBA":
                     background = Image.new("RGB", image.size, (255, 255, 255))
                     background.paste(
-                        image, mask=image.split()[-1] if image.mode == "RGBA" else None
+                        image, mask=image if image.mode == "RGBA" else None
                     )
                     image = background
             elif file_ext == ".webp":
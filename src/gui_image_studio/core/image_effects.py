@@ -8,10 +8,12 @@ without side effects like I/O or progress bars.
 New effects can be registered using the effects registry system for automatic discovery.
 """
 
+import struct
+from functools import lru_cache
 from io import BytesIO
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+from PIL import Image, ImageEnhance, ImageFilter, ImageOps, ImageStat
 
 # Import the effects registry for new effect registration
 from .effects_registry import (
@@ -23,6 +25,12 @@ from .effects_registry import (
     int_parameter,
 )
 
+# Handle different Pillow versions
+try:
+    _DEFAULT_RESAMPLE = Image.Resampling.LANCZOS
+except AttributeError:
+    _DEFAULT_RESAMPLE = Image.LANCZOS  # type: ignore
+
 
 def resize(
     image: Image.Image,
@@ -43,11 +51,7 @@ def resize(
         Resized PIL Image object
     """
     if resample is None:
-        # Handle different Pillow versions
-        try:
-            resample = Image.Resampling.LANCZOS
-        except AttributeError:
-            resample = Image.LANCZOS  # type: ignore
+        resample = _DEFAULT_RESAMPLE
 
     if preserve_aspect:
         # Calculate size preserving aspect ratio
@@ -120,6 +124,9 @@ def apply_contrast(image: Image.Image, factor: float) -> Image.Image:
     if factor < 0.0:
         raise ValueError("Contrast factor must be non-negative")
 
+    if image.mode in ("RGB", "RGBA"):
+        return _apply_tone_table(image, factor, 1.0)
+
     enhancer = ImageEnhance.Contrast(image)
     return enhancer.enhance(factor)
 
@@ -156,10 +163,70 @@ def apply_brightness(image: Image.Image, factor: float) -> Image.Image:
     if factor < 0.0:
         raise ValueError("Brightness factor must be non-negative")
 
+    if image.mode in ("RGB", "RGBA"):
+        return _apply_tone_table(image, 1.0, factor)
+
     enhancer = ImageEnhance.Brightness(image)
     return enhancer.enhance(factor)
 
 
+def _apply_contrast_brightness(
+    image: Image.Image, contrast: float, brightness: float
+) -> Image.Image:
+    """Adjust contrast and then brightness, in one pass for RGB(A) images."""
+    if image.mode not in ("RGB", "RGBA"):
+        return apply_brightness(apply_contrast(image, contrast), brightness)
+    if contrast < 0.0:
+        raise ValueError("Contrast factor must be non-negative")
+    if brightness < 0.0:
+        raise ValueError("Brightness factor must be non-negative")
+    return _apply_tone_table(image, contrast, brightness)
+
+
+def _float32(value: float) -> float:
+    """Round a Python float to single precision."""
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def _apply_tone_table(
+    image: Image.Image, contrast: float, brightness: float
+) -> Image.Image:
+    """Apply contrast then brightness to the colour bands as one lookup table.
+
+    The table reproduces ImageEnhance's blends (towards the mean grey, then
+    towards black) value for value, but maps each pixel once instead of
+    building a degenerate image and blending per enhancement.
+    """
+    mean = 0
+    if contrast != 1.0:
+        mean = int(ImageStat.Stat(image.convert("L")).mean[0] + 0.5)
+    return image.point(_tone_lut(mean, contrast, brightness, image.mode == "RGBA"))
+
+
+@lru_cache(maxsize=256)
+def _tone_lut(
+    mean: int, contrast: float, brightness: float, has_alpha: bool
+) -> Tuple[int, ...]:
+    """Build the lookup table used by _apply_tone_table.
+
+    Slider drags repeat the same factors, so tables are cached per input.
+    """
+    contrast = _float32(contrast)
+    brightness = _float32(brightness)
+
+    # Pillow blends in single precision; round each step the same way
+    table = []
+    for value in range(256):
+        value = int(_float32(mean + _float32(contrast * (value - mean))))
+        value = min(255, max(0, value))
+        table.append(min(255, max(0, int(_float32(brightness * value)))))
+
+    lut = table * 3
+    if has_alpha:
+        lut += range(256)  # Alpha passes through unchanged
+    return tuple(lut)
+
+
 def apply_sharpness(image: Image.Image, factor: float) -> Image.Image:
     """
     Adjust image sharpness.
@@ -219,17 +286,40 @@ def apply_tint(
     if image.mode != "RGBA":
         image = image.convert("RGBA")
 
-    # Create tint overlay
-    overlay = Image.new("RGBA", image.size, tint_color + (255,))
+    # Blending towards a constant colour is a per-band mapping, so apply it
+    # as a lookup table instead of allocating a full-size overlay to blend
+    return image.point(_tint_lut(tuple(tint_color), intensity))
+
+
+@lru_cache(maxsize=256)
+def _tint_lut(tint_color: Tuple[int, ...], intensity: float) -> Tuple[int, ...]:
+    """Build the RGBA lookup table that blends each band towards the tint.
+
+    Steps are rounded to single precision to match Image.blend exactly.
+    """
+    alpha = _float32(intensity)
+    lut: List[int] = []
+    for target in tint_color + (255,):
+        lut.extend(
+            min(255, max(0, int(_float32(value + _float32(alpha * (target - value))))))
+            for value in range(256)
+        )
+    return tuple(lut)
 
-    # Blend with original image
-    return Image.blend(image, overlay, intensity)
+
+# Modes the JPEG and PNG writers store as-is
+_JPEG_MODES = ("RGB", "L", "CMYK")
+_PNG_MODES = ("RGBA", "RGB", "LA", "L", "P", "1", "I", "I;16")
 
 
 def apply_format_conversion(image: Image.Image, target_format: str) -> Image.Image:
     """
     Convert image to a different format.
 
+    JPEG and PNG only restrict the pixel mode, so they are converted in memory
+    without encoding. Other formats are encoded and decoded, since their
+    writers may quantize or compress lossily.
+
     Args:
         image: PIL Image object to convert
         target_format: Target format (PNG, JPEG, etc.)
@@ -237,18 +327,24 @@ def apply_format_conversion(image: Image.Image, target_format: str) -> Image.Ima
     Returns:
         PIL Image object in the target format
     """
-    buffer = BytesIO()
+    target = target_format.upper()
 
     # Handle JPEG format (no alpha channel)
-    if target_format.upper() == "JPEG":
-        if image.mode in ("RGBA", "LA"):
+    if target == "JPEG":
+        if image.mode == "RGBA" and image.getchannel("A").getextrema()[0] == 255:
+            # Fully opaque: compositing onto white would only drop the alpha
+            image = image.convert("RGB")
+        elif image.mode in ("RGBA", "LA"):
             # Create white background for transparency
             background = Image.new("RGB", image.size, (255, 255, 255))
-            background.paste(
-                image, mask=image.split()[-1] if image.mode == "RGBA" else None
-            )
+            background.paste(image, mask=image if image.mode == "RGBA" else None)
             image = background
+        if image.mode in _JPEG_MODES:
+            return image
+    elif target == "PNG" and image.mode in _PNG_MODES:
+        return image
 
+    buffer = BytesIO()
     image.save(buffer, format=target_format)
     buffer.seek(0)
     return Image.open(buffer)
@@ -282,43 +378,121 @@ def apply_transformations(image: Image.Image, **transforms: Any) -> Image.Image:
     tint_intensity = transforms.get("tint_intensity", 0.0)
     format_override = transforms.get("format_override")
 
+    # Near-quarter turns become exact ones, which Pillow does by transposing
+    rotate = _snap_angle(rotate)
+
+    params = (
+        grayscale,
+        rotate,
+        transparency,
+        size,
+        contrast,
+        saturation,
+        brightness,
+        sharpness,
+        blur_radius,
+        tint_color,
+        tint_intensity,
+        format_override,
+    )
+    try:
+        steps = _transform_steps(*params)
+    except TypeError:
+        # Unhashable parameters (e.g. a size given as a list) skip the cache
+        steps = _transform_steps.__wrapped__(*params)
+
     # Apply transformations in sequence
     result = image
+    for step, args in steps:
+        result = step(result, *args)
+
+    return result
+
+
+# Slider values within these of a no-op (e.g. 1.0000001 from a Tk DoubleVar)
+# are treated as the no-op, since PIL would still walk every pixel for them
+_FACTOR_TOLERANCE = 1e-3
+_ANGLE_TOLERANCE = 0.05
+_BLUR_TOLERANCE = 0.05
+
+
+def _is_identity(factor: float) -> bool:
+    """Return True if an enhancement factor is close enough to 1.0 to skip."""
+    return abs(factor - 1.0) < _FACTOR_TOLERANCE
+
+
+def _snap_angle(angle: float) -> float:
+    """Round an angle to the nearest quarter turn if it is within tolerance."""
+    quarter = round(angle / 90) * 90
+    if abs(angle - quarter) < _ANGLE_TOLERANCE:
+        return quarter
+    return angle
+
+
+@lru_cache(maxsize=64)
+def _transform_steps(
+    grayscale: bool,
+    rotate: float,
+    transparency: float,
+    size: Optional[Tuple[int, int]],
+    contrast: float,
+    saturation: float,
+    brightness: float,
+    sharpness: float,
+    blur_radius: float,
+    tint_color: Any,
+    tint_intensity: float,
+    format_override: Optional[str],
+) -> Tuple[Tuple[Callable[..., Image.Image], Tuple[Any, ...]], ...]:
+    """List the (function, extra args) steps for a set of transform parameters.
+
+    Inactive transforms are left out, so repeated previews with the same
+    settings run a prebuilt list instead of re-testing every parameter.
+    """
+    steps: List[Tuple[Callable[..., Image.Image], Tuple[Any, ...]]] = []
 
     if grayscale:
-        result = apply_grayscale(result)
+        steps.append((apply_grayscale, ()))
 
-    if rotate != 0:
-        result = apply_rotation(result, rotate)
+    if rotate % 360 != 0:
+        steps.append((apply_rotation, (rotate,)))
 
-    if transparency != 1.0:
-        result = apply_transparency(result, transparency)
+    if not _is_identity(transparency):
+        steps.append((apply_transparency, (transparency,)))
 
     if size:
-        result = resize(result, size)
-
-    if contrast != 1.0:
-        result = apply_contrast(result, contrast)
+        steps.append((resize, (size,)))
+
+    if (
+        not _is_identity(contrast)
+        and not _is_identity(brightness)
+        and _is_identity(saturation)
+    ):
+        # Nothing runs between them, so both share one lookup table
+        steps.append((_apply_contrast_brightness, (contrast, brightness)))
+    else:
+        if not _is_identity(contrast):
+            steps.append((apply_contrast, (contrast,)))
 
-    if saturation != 1.0:
-        result = apply_saturation(result, saturation)
+        if not _is_identity(saturation):
+            steps.append((apply_saturation, (saturation,)))
 
-    if brightness != 1.0:
-        result = apply_brightness(result, brightness)
+        if not _is_identity(brightness):
+            steps.append((apply_brightness, (brightness,)))
 
-    if sharpness != 1.0:
-        result = apply_sharpness(result, sharpness)
+    if not _is_identity(sharpness):
+        steps.append((apply_sharpness, (sharpness,)))
 
-    if blur_radius > 0.0:
-        result = apply_blur(result, blur_radius)
+    if blur_radius > _BLUR_TOLERANCE:
+        steps.append((apply_blur, (blur_radius,)))
 
     if tint_color is not None and tint_intensity > 0.0:
-        result = apply_tint(result, tint_color, tint_intensity)
+        steps.append((apply_tint, (tint_color, tint_intensity)))
 
     if format_override:
-        result = apply_format_conversion(result, format_override)
+        steps.append((apply_format_conversion, (format_override,)))
 
-    return result
+    return tuple(steps)
 
 
 # Convenience functions for common operations
@@ -334,7 +508,7 @@ def create_thumbnail(image: Image.Image, size: Tuple[int, int]) -> Image.Image:
         Thumbnail PIL Image object
     """
     thumbnail = image.copy()
-    thumbnail.thumbnail(size, Image.Resampling.LANCZOS)
+    thumbnail.thumbnail(size, _DEFAULT_RESAMPLE)
     return thumbnail
 
 
@@ -124,9 +124,7 @@ def save_image(
             if image.mode in ("RGBA", "LA"):
                 # Create white background for transparency
                 background = Image.new("RGB", image.size, (255, 255, 255))
-                background.paste(
-                    image, mask=image.split()[-1] if image.mode == "RGBA" else None
-                )
+                background.paste(image, mask=image if image.mode == "RGBA" else None)
                 image = background
             image.save(path, format=format, quality=quality, **kwargs)
         else:
@@ -162,9 +160,7 @@ def image_to_bytes(
             if image.mode in ("RGBA", "LA"):
                 # Create white background for transparency
                 background = Image.new("RGB", image.size, (255, 255, 255))
-                background.paste(
-                    image, mask=image.split()[-1] if image.mode == "RGBA" else None
-                )
+                background.paste(image, mask=image if image.mode == "RGBA" else None)
                 image = background
             image.save(buffer, format=format, quality=quality, **kwargs)
         else:
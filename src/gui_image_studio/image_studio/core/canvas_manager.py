@@ -2,19 +2,89 @@
 Canvas management functionality.
 """
 
+import logging
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Optional, Tuple
 
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageTk
+
+from ..toolkit.tools import get_draw, parse_color, release_draw
+
+# Optional faster integer zoom
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 if TYPE_CHECKING:
     from ..main_app import EnhancedImageDesignerGUI
 
+log = logging.getLogger(__name__)
+
+
+def zoom_nearest(image: Image.Image, size: Tuple[int, int], pixels=None) -> Image.Image:
+    """Scale an image for display without smoothing.
+
+    Whole-number upscales are a plain pixel repeat, which NumPy does faster than
+    PIL's resampler: from 3x for RGBA, whose pixels are repeated as single
+    32-bit words, and from 5x for RGB and L. ``pixels`` may carry an already
+    converted array of the image. Everything else goes through resize. At 100%
+    the image itself is returned, as resize would only copy it.
+    """
+    if size == image.size:
+        return image
+    scale = size[0] // image.width if image.width else 0
+    if NUMPY_AVAILABLE and size == (image.width * scale, image.height * scale):
+        if image.mode == "RGBA" and scale >= 3:
+            if pixels is None:
+                pixels = np.asarray(image)
+            if pixels.flags.c_contiguous:
+                words = pixels.view(np.uint32)[..., 0]
+                words = words.repeat(scale, axis=1).repeat(scale, axis=0)
+                return Image.fromarray(
+                    words.view(np.uint8).reshape(size[1], size[0], 4)
+                )
+        elif image.mode in ("RGB", "L") and scale >= 5:
+            if pixels is None:
+                pixels = np.asarray(image)
+            return Image.fromarray(pixels.repeat(scale, axis=0).repeat(scale, axis=1))
+    return image.resize(size, Image.Resampling.NEAREST)
+
+
+def image_pixels(image: Image.Image):
+    """Return an image's pixels as an array for zoom_nearest, or None."""
+    return np.asarray(image) if NUMPY_AVAILABLE else None
+
 
 class CanvasManager:
     """Manages the drawing canvas operations."""
 
+    # Canvas position of the image's top-left pixel (the main window draws the
+    # image at (10, 10))
+    IMG_ORIGIN = 10
+
+    # The motion handler reads several of these per event; slots keep those
+    # lookups off the instance dict
+    __slots__ = (
+        "app",
+        "canvas",
+        "canvas_image",
+        "canvas_photo",
+        "canvas_item_id",
+        "_tools_version",
+        "_preview_tools",
+        "_text_tools",
+        "_release_tools",
+        "_immediate_click_tools",
+        "_immediate_drag_tools",
+        "_motion_dispatch",
+        "_scroll_origin",
+        "_highlight_id",
+    )
+
     def __init__(self, app: "EnhancedImageDesignerGUI"):
         self.app = app
         self.canvas: Optional[tk.Canvas] = None
@@ -22,6 +92,23 @@ class CanvasManager:
         self.canvas_photo: Optional[ImageTk.PhotoImage] = None
         self.canvas_item_id: Optional[int] = None
 
+        # Tool names grouped by how the event handlers treat them, rebuilt only
+        # when the tool registry changes
+        self._tools_version = -1
+        self._preview_tools: FrozenSet[str] = frozenset()
+        self._text_tools: FrozenSet[str] = frozenset()
+        self._release_tools: FrozenSet[str] = frozenset()
+        self._immediate_click_tools: FrozenSet[str] = frozenset()
+        self._immediate_drag_tools: FrozenSet[str] = frozenset()
+        self._motion_dispatch: Dict[str, Callable[[int, int, float], None]] = {}
+
+        # Canvas coordinates of the window's top-left corner, dropped whenever
+        # the view scrolls
+        self._scroll_origin: Optional[Tuple[float, float]] = None
+
+        # Pixel highlight rectangle, hidden rather than deleted between uses
+        self._highlight_id: Optional[int] = None
+
     def create_canvas(self, parent) -> tk.Canvas:
         """Create and setup the drawing canvas."""
         # Create canvas with scrollbars - exact copy from original
@@ -35,7 +122,8 @@ class CanvasManager:
         )
 
         self.canvas.configure(
-            xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set
+            xscrollcommand=self._scroll_command(h_scrollbar.set),
+            yscrollcommand=self._scroll_command(v_scrollbar.set),
         )
 
         self.canvas.grid(row=0, column=0, sticky="nsew")
@@ -53,6 +141,25 @@ class CanvasManager:
 
         return self.canvas
 
+    def _scroll_command(self, scrollbar_set):
+        """Wrap a scrollbar's set so every view change drops the cached origin."""
+
+        def command(first, last):
+            self._scroll_origin = None
+            scrollbar_set(first, last)
+
+        return command
+
+    def _get_scroll_origin(self) -> Tuple[float, float]:
+        """Get the canvas coordinates of the window's top-left corner.
+
+        Tk reports every view change through the scroll commands, so the two
+        canvasx/canvasy round-trips are only needed after a scroll or resize.
+        """
+        if self._scroll_origin is None:
+            self._scroll_origin = (self.canvas.canvasx(0), self.canvas.canvasy(0))
+        return self._scroll_origin
+
     def setup_canvas_bindings(self):
         """Setup canvas event bindings."""
         self.canvas.bind("<Button-1>", self.on_canvas_click)
@@ -78,7 +185,8 @@ class CanvasManager:
         )
 
         # Resize image for display
-        display_image = self.canvas_image.resize(display_size, Image.Resampling.NEAREST)
+        display_image = zoom_nearest(self.canvas_image, display_size)
+
         self.canvas_photo = ImageTk.PhotoImage(display_image)
 
         # Clear canvas and add image
@@ -111,8 +219,9 @@ class CanvasManager:
     def clear_canvas(self) -> None:
         """Clear the canvas."""
         if self.canvas_image:
-            self.canvas_image = Image.new(
-                "RGBA", self.canvas_image.size, (255, 255, 255, 255)
+            # Fill the existing image in place rather than allocating a new one
+            self.canvas_image.paste(
+                (255, 255, 255, 255), (0, 0) + self.canvas_image.size
             )
             self.update_canvas_display()
 
@@ -122,8 +231,9 @@ class CanvasManager:
             return 0, 0
 
         # Get canvas coordinates
-        canvas_x = self.canvas.canvasx(event.x)
-        canvas_y = self.canvas.canvasy(event.y)
+        origin_x, origin_y = self._get_scroll_origin()
+        canvas_x = event.x + origin_x
+        canvas_y = event.y + origin_y
 
         # Convert to image coordinates considering zoom
         zoom = self.app.drawing_tools.get_zoom_level()
@@ -137,16 +247,22 @@ class CanvasManager:
         if not self.canvas_image:
             return
 
-        draw = ImageDraw.Draw(self.canvas_image)
+        color = parse_color(color)
 
         if size == 1:
-            # Single pixel
-            if 0 <= x < self.canvas_image.width and 0 <= y < self.canvas_image.height:
-                draw.point((x, y), fill=color)
+            # Single pixel, written straight into the pixel buffer
+            image = self.canvas_image
+            if 0 <= x < image.width and 0 <= y < image.height:
+                if isinstance(color, tuple) and image.mode == "RGBA":
+                    image.load()[x, y] = color
+                else:
+                    get_draw(image).point((x, y), fill=color)
         else:
             # Brush stroke
             radius = size // 2
-            draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color)
+            get_draw(self.canvas_image).ellipse(
+                (x - radius, y - radius, x + radius, y + radius), fill=color
+            )
 
         self.update_canvas_display()
 
@@ -157,8 +273,8 @@ class CanvasManager:
         if not self.canvas_image:
             return
 
-        draw = ImageDraw.Draw(self.canvas_image)
-        draw.line((x1, y1, x2, y2), fill=color, width=width)
+        draw = get_draw(self.canvas_image)
+        draw.line((x1, y1, x2, y2), fill=parse_color(color), width=width)
         self.update_canvas_display()
 
     def draw_rectangle(
@@ -168,7 +284,8 @@ class CanvasManager:
         if not self.canvas_image:
             return
 
-        draw = ImageDraw.Draw(self.canvas_image)
+        draw = get_draw(self.canvas_image)
+        color = parse_color(color)
         if filled:
             draw.rectangle((x1, y1, x2, y2), fill=color)
         else:
@@ -182,50 +299,84 @@ class CanvasManager:
         if not self.canvas_image:
             return
 
-        draw = ImageDraw.Draw(self.canvas_image)
+        draw = get_draw(self.canvas_image)
+        color = parse_color(color)
         if filled:
             draw.ellipse((x1, y1, x2, y2), fill=color)
         else:
             draw.ellipse((x1, y1, x2, y2), outline=color)
         self.update_canvas_display()
 
+    def _refresh_tool_caches(self) -> None:
+        """Regroup tool names by capability if the tool registry has changed."""
+        tools = self.app.drawing_tools
+        version = tools.get_tools_version()
+        if version == self._tools_version:
+            return
+        self._tools_version = version
+
+        preview = frozenset(tools.get_tools_by_capability("preview"))
+        text = frozenset(tools.get_tools_by_capability("text_input"))
+        self._preview_tools = preview
+        self._text_tools = text
+        self._release_tools = frozenset(tools.get_tools_by_capability("release"))
+        # Tools that draw immediately (not preview or text tools)
+        self._immediate_click_tools = (
+            frozenset(tools.get_tools_by_capability("click")) - preview - text
+        )
+        # Tools that support drag but not preview
+        self._immediate_drag_tools = (
+            frozenset(tools.get_tools_by_capability("drag")) - preview
+        )
+
+        # Motion handling per tool; anything else just drops the highlight
+        self._motion_dispatch = {
+            **{name: self._motion_shape for name in preview},
+            **{name: self._motion_highlight for name in self._immediate_click_tools},
+        }
+
     # Canvas event handlers - copied from original
+    def _event_to_image(self, event, zoom: Optional[float] = None) -> Tuple[int, int]:
+        """Convert an event position to image pixel coordinates.
+
+        Handlers that already read the zoom level pass it along.
+        """
+        origin = self._get_scroll_origin()
+        if zoom is None:
+            zoom = self.app.drawing_tools.get_zoom_level()
+        return (
+            self._canvas_to_image(event.x + origin[0], zoom),
+            self._canvas_to_image(event.y + origin[1], zoom),
+        )
+
+    def _image_to_canvas(self, value: float, zoom: float) -> float:
+        """Map an image coordinate to the canvas coordinate of its pixel edge."""
+        return value * zoom + self.IMG_ORIGIN
+
+    def _canvas_to_image(self, value: float, zoom: float) -> int:
+        """Map a canvas coordinate to the image pixel containing it."""
+        return int((value - self.IMG_ORIGIN) / zoom)
+
     def on_canvas_click(self, event):
         """Handle canvas click events."""
         if not self.app.selected_image:
             return
 
         # Convert canvas coordinates to image coordinates
-        x = int(
-            (self.canvas.canvasx(event.x) - 10)
-            / self.app.drawing_tools.get_zoom_level()
-        )
-        y = int(
-            (self.canvas.canvasy(event.y) - 10)
-            / self.app.drawing_tools.get_zoom_level()
-        )
+        x, y = self._event_to_image(event)
 
         current_tool = self.app.drawing_tools.get_current_tool()
+        self._refresh_tool_caches()
 
-        # Get tools that support click operations (excluding preview tools and text)
-        click_tools = self.app.drawing_tools.get_tools_by_capability("click")
-        preview_tools = self.app.drawing_tools.get_tools_by_capability("preview")
-        text_tools = self.app.drawing_tools.get_tools_by_capability("text_input")
-
-        # Remove preview and text tools from click tools for immediate drawing
-        immediate_click_tools = [
-            t for t in click_tools if t not in preview_tools and t not in text_tools
-        ]
-
-        if current_tool in immediate_click_tools:
+        if current_tool in self._immediate_click_tools:
             self.app.last_x, self.app.last_y = x, y
             self.app.draw_on_image(x, y)
-        elif current_tool in preview_tools:
+        elif current_tool in self._preview_tools:
             self.app.drawing = True
             self.app.start_x, self.app.start_y = x, y
-            print(f"Shape tool {current_tool} started at ({x}, {y})")  # Debug
+            log.debug("Shape tool %s started at (%d, %d)", current_tool, x, y)
 
-        elif current_tool in text_tools:
+        elif current_tool in self._text_tools:
             # Use the drawing tools system for text
             image = self.app.current_images[self.app.selected_image]
             kwargs = {
@@ -241,56 +392,49 @@ class CanvasManager:
             return
 
         # Convert canvas coordinates to image coordinates
-        x = int(
-            (self.canvas.canvasx(event.x) - 10)
-            / self.app.drawing_tools.get_zoom_level()
-        )
-        y = int(
-            (self.canvas.canvasy(event.y) - 10)
-            / self.app.drawing_tools.get_zoom_level()
-        )
+        x, y = self._event_to_image(event)
 
         current_tool = self.app.drawing_tools.get_current_tool()
+        self._refresh_tool_caches()
 
-        # Get tools that support drag operations
-        drag_tools = self.app.drawing_tools.get_tools_by_capability("drag")
-        preview_tools = self.app.drawing_tools.get_tools_by_capability("preview")
-
-        # Tools that support drag but not preview (immediate drawing)
-        immediate_drag_tools = [t for t in drag_tools if t not in preview_tools]
-
-        if current_tool in immediate_drag_tools:
-            if hasattr(self.app, "last_x") and hasattr(self.app, "last_y"):
+        if current_tool in self._immediate_drag_tools:
+            if self.app.last_x is not None:
                 self.app.draw_line_on_image(self.app.last_x, self.app.last_y, x, y)
             self.app.last_x, self.app.last_y = x, y
-        elif self.app.drawing and current_tool in preview_tools:
+        elif self.app.drawing and current_tool in self._preview_tools:
             # Show preview while dragging
             self.update_shape_preview(self.app.start_x, self.app.start_y, x, y)
 
     def on_canvas_release(self, event):
         """Handle canvas release events."""
+        # The stroke is over; the next drag must start from a fresh click
+        self.app.last_x = self.app.last_y = None
+
+        try:
+            self._finish_stroke(event)
+        finally:
+            release_draw()
+
+    def _finish_stroke(self, event):
+        """Draw the final shape for shape tools when the mouse is released."""
         if not self.app.selected_image:
             return
 
         current_tool = self.app.drawing_tools.get_current_tool()
+        self._refresh_tool_caches()
 
-        # Get tools that support release operations (preview tools)
-        release_tools = self.app.drawing_tools.get_tools_by_capability("release")
-
-        if self.app.drawing and current_tool in release_tools:
+        if self.app.drawing and current_tool in self._release_tools:
             # Convert canvas coordinates to image coordinates
-            x = int(
-                (self.canvas.canvasx(event.x) - 10)
-                / self.app.drawing_tools.get_zoom_level()
-            )
-            y = int(
-                (self.canvas.canvasy(event.y) - 10)
-                / self.app.drawing_tools.get_zoom_level()
+            x, y = self._event_to_image(event)
+
+            log.debug(
+                "Shape tool %s finished at (%d, %d) from (%d, %d)",
+                current_tool,
+                x,
+                y,
+                self.app.start_x,
+                self.app.start_y,
             )
-
-            print(
-                f"Shape tool {current_tool} finished at ({x}, {y}) from ({self.app.start_x}, {self.app.start_y})"
-            )  # Debug
             self.app.draw_shape(self.app.start_x, self.app.start_y, x, y)
             self.app.drawing = False
             self.clear_preview()
@@ -301,55 +445,43 @@ class CanvasManager:
             return
 
         # Convert canvas coordinates to image coordinates
-        x = int(
-            (self.canvas.canvasx(event.x) - 10)
-            / self.app.drawing_tools.get_zoom_level()
-        )
-        y = int(
-            (self.canvas.canvasy(event.y) - 10)
-            / self.app.drawing_tools.get_zoom_level()
-        )
+        zoom = self.app.drawing_tools.get_zoom_level()
+        x, y = self._event_to_image(event, zoom=zoom)
 
-        # Show pixel highlight for drawing tools when grid is enabled
-        current_tool = self.app.drawing_tools.get_current_tool()
+        # Motion within the already highlighted pixel changes nothing
+        if not self.app.drawing and self.app.last_highlight_pos == (x, y):
+            return
 
-        # Get tools that support immediate drawing (for pixel highlighting)
-        immediate_draw_tools = self.app.drawing_tools.get_tools_by_capability("click")
-        preview_tools = self.app.drawing_tools.get_tools_by_capability("preview")
-        text_tools = self.app.drawing_tools.get_tools_by_capability("text_input")
+        self._refresh_tool_caches()
+        handler = self._motion_dispatch.get(
+            self.app.drawing_tools.get_current_tool(), self._motion_other
+        )
+        handler(x, y, zoom)
 
-        # Tools that draw immediately (not preview or text tools)
-        pixel_highlight_tools = [
-            t
-            for t in immediate_draw_tools
-            if t not in preview_tools and t not in text_tools
-        ]
-
-        if (
-            self.app.drawing_tools.show_grid
-            and current_tool in pixel_highlight_tools
-            and self.app.drawing_tools.get_zoom_level() >= 4
-        ):
-            self.update_pixel_highlight(x, y)
+    def _motion_highlight(self, x: int, y: int, zoom: float) -> None:
+        """Show the pixel highlight for tools that draw immediately."""
+        # Only when the grid is enabled and pixels are large enough to see
+        if self.app.drawing_tools.show_grid and zoom >= 4:
+            self.update_pixel_highlight(x, y, zoom)
         else:
             self.clear_pixel_highlight()
 
-        # Show shape preview for shape tools when drawing
-        if self.app.drawing and current_tool in ["rectangle", "circle", "line"]:
+    def _motion_shape(self, x: int, y: int, zoom: float) -> None:
+        """Follow the pointer with the shape preview while drawing a shape."""
+        self.clear_pixel_highlight()
+        if self.app.drawing:
             self.update_shape_preview(self.app.start_x, self.app.start_y, x, y)
 
+    def _motion_other(self, x: int, y: int, zoom: float) -> None:
+        """Drop the pixel highlight for tools without motion feedback."""
+        self.clear_pixel_highlight()
+
     def update_shape_preview(self, x1, y1, x2, y2):
         """Update the preview shape on canvas."""
         # Clear existing preview
         self.clear_preview()
 
-        # Convert image coordinates back to canvas coordinates for display
-        canvas_x1 = x1 * self.app.drawing_tools.get_zoom_level() + 10
-        canvas_y1 = y1 * self.app.drawing_tools.get_zoom_level() + 10
-        canvas_x2 = x2 * self.app.drawing_tools.get_zoom_level() + 10
-        canvas_y2 = y2 * self.app.drawing_tools.get_zoom_level() + 10
-
-        # Create preview shape using new tool system
+        # Create preview shape using new tool system (it maps to canvas space)
         preview_id = self.app.drawing_tools.create_preview(self.canvas, x1, y1, x2, y2)
         if preview_id:
             self.app.preview_shape = preview_id
@@ -366,7 +498,7 @@ class CanvasManager:
             self.app.preview_shape = None
         self.app.preview_active = False
 
-    def update_pixel_highlight(self, x, y):
+    def update_pixel_highlight(self, x, y, zoom=None):
         """Highlight the pixel that will be affected by drawing tools."""
         # Only highlight if position changed
         if self.app.last_highlight_pos == (x, y):
@@ -374,37 +506,54 @@ class CanvasManager:
 
         self.app.last_highlight_pos = (x, y)
 
-        # Clear existing highlight
-        self.clear_pixel_highlight()
-
         # Check if coordinates are within image bounds
         if not self.app.selected_image:
+            self._hide_pixel_highlight()
             return
 
         image = self.app.current_images[self.app.selected_image]
         if x < 0 or y < 0 or x >= image.width or y >= image.height:
+            self._hide_pixel_highlight()
             return
 
         # Convert image coordinates to canvas coordinates
-        canvas_x = x * self.app.drawing_tools.get_zoom_level() + 10
-        canvas_y = y * self.app.drawing_tools.get_zoom_level() + 10
-
-        # Create highlight rectangle around the pixel
-        self.app.pixel_highlight = self.canvas.create_rectangle(
-            canvas_x,
-            canvas_y,
-            canvas_x + self.app.drawing_tools.get_zoom_level(),
-            canvas_y + self.app.drawing_tools.get_zoom_level(),
-            outline="#FF0000",
-            width=1,
-            fill="",
-            dash=(2, 2),
-            tags="pixel_highlight",
-        )
+        if zoom is None:
+            zoom = self.app.drawing_tools.get_zoom_level()
+        canvas_x = self._image_to_canvas(x, zoom)
+        canvas_y = self._image_to_canvas(y, zoom)
+        box = (canvas_x, canvas_y, canvas_x + zoom, canvas_y + zoom)
 
-    def clear_pixel_highlight(self):
-        """Clear the pixel highlight from canvas."""
+        # A highlight on screen is simply moved
+        if self.app.pixel_highlight:
+            self.canvas.coords(self.app.pixel_highlight, *box)
+            return
+
+        # Otherwise show the hidden rectangle again, unless the canvas has been
+        # cleared since, in which case create it
+        item = self._highlight_id
+        if item is not None and self.canvas.type(item) == "rectangle":
+            self.canvas.coords(item, *box)
+            self.canvas.itemconfigure(item, state="normal")
+            # Items drawn since it was hidden (e.g. the grid) would cover it
+            self.canvas.tag_raise(item)
+        else:
+            item = self._highlight_id = self.canvas.create_rectangle(
+                *box,
+                outline="#FF0000",
+                width=1,
+                fill="",
+                dash=(2, 2),
+                tags="pixel_highlight",
+            )
+        self.app.pixel_highlight = item
+
+    def _hide_pixel_highlight(self):
+        """Hide the pixel highlight, keeping its rectangle for reuse."""
         if self.app.pixel_highlight:
-            self.canvas.delete(self.app.pixel_highlight)
+            self.canvas.itemconfigure(self.app.pixel_highlight, state="hidden")
             self.app.pixel_highlight = None
+
+    def clear_pixel_highlight(self):
+        """Clear the pixel highlight from canvas."""
+        self._hide_pixel_highlight()
         self.app.last_highlight_pos = None
@@ -2,12 +2,22 @@
 Drawing tools manager - manages tool selection and delegates to individual tools.
 """
 
-from typing import Any, Dict, List, Optional
+from operator import methodcaller
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from PIL import Image
 
 from ..toolkit.tools import BaseTool, ToolRegistry
 
+# Capability names accepted by get_tools_by_capability and their predicates
+_CAPABILITY_CHECKS: Dict[str, Callable[[BaseTool], bool]] = {
+    "click": methodcaller("supports_click"),
+    "drag": methodcaller("supports_drag"),
+    "release": methodcaller("supports_release"),
+    "preview": methodcaller("supports_preview"),
+    "text_input": methodcaller("requires_text_input"),
+}
+
 
 class DrawingToolsManager:
     """Manages drawing tools and their settings using a modular tool system."""
@@ -35,6 +45,14 @@ class DrawingToolsManager:
         # Tool-specific settings storage
         self.tool_settings = {}
 
+        # Last merge of global and tool settings, and the state it was built from
+        self._merged_base: Dict[str, Any] = {}
+        self._merged_state: Optional[Tuple[Any, ...]] = None
+
+        # Capability lookups, rebuilt when the registry changes
+        self._tools_version = -1
+        self._capability_cache: Dict[str, Tuple[str, ...]] = {}
+
         # Initialize tool settings for all registered tools
         self._initialize_tool_settings()
 
@@ -44,53 +62,49 @@ class DrawingToolsManager:
             if hasattr(tool, "settings"):
                 self.tool_settings[tool_name] = tool.settings.copy()
 
+    def _check_tool_caches(self) -> None:
+        """Drop cached tool lookups if tools were registered since they were built."""
+        version = ToolRegistry.get_version()
+        if version != self._tools_version:
+            self._tools_version = version
+            self._capability_cache.clear()
+
     def get_available_tools(self) -> List[str]:
         """Get list of all available tool names."""
         return ToolRegistry.get_tool_names()
 
     def get_tool_info(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific tool."""
-        tool = ToolRegistry.get_tool(tool_name)
-        if tool:
-            return {
-                "name": tool.name,
-                "display_name": tool.display_name,
-                "description": tool.get_description(),
-                "icon": tool.get_icon(),
-                "cursor": tool.cursor,
-                "supports_preview": tool.supports_preview(),
-            }
-        return None
+        return ToolRegistry.get_tool_info(tool_name)
 
     def get_all_tool_info(self) -> Dict[str, Dict[str, Any]]:
         """Get information about all registered tools."""
-        tools_info = {}
-        for tool_name, tool in ToolRegistry.get_all_tools().items():
-            tools_info[tool_name] = {
-                "name": tool.name,
-                "display_name": tool.display_name,
-                "description": tool.get_description(),
-                "icon": tool.get_icon(),
-                "cursor": tool.cursor,
-                "supports_preview": tool.supports_preview(),
-            }
-        return tools_info
+        return {
+            tool_name: self.get_tool_info(tool_name)
+            for tool_name in ToolRegistry.get_tool_names()
+        }
 
     def get_tools_by_capability(self, capability: str) -> List[str]:
         """Get list of tool names that support a specific capability."""
-        tools = []
+        self._check_tool_caches()
+        if not self._capability_cache:
+            self._build_capability_index()
+        return list(self._capability_cache.get(capability, ()))
+
+    def _build_capability_index(self) -> None:
+        """Index tool names by capability in a single pass over the registry."""
+        index: Dict[str, List[str]] = {name: [] for name in _CAPABILITY_CHECKS}
         for tool_name, tool in ToolRegistry.get_all_tools().items():
-            if capability == "click" and tool.supports_click():
-                tools.append(tool_name)
-            elif capability == "drag" and tool.supports_drag():
-                tools.append(tool_name)
-            elif capability == "release" and tool.supports_release():
-                tools.append(tool_name)
-            elif capability == "preview" and tool.supports_preview():
-                tools.append(tool_name)
-            elif capability == "text_input" and tool.requires_text_input():
-                tools.append(tool_name)
-        return tools
+            for capability, check in _CAPABILITY_CHECKS.items():
+                if check(tool):
+                    index[capability].append(tool_name)
+        self._capability_cache.update(
+            (capability, tuple(names)) for capability, names in index.items()
+        )
+
+    def get_tools_version(self) -> int:
+        """Get a counter that changes whenever tools are registered."""
+        return ToolRegistry.get_version()
 
     def select_tool(self, tool_name: str) -> bool:
         """Select a drawing tool by name."""
@@ -147,35 +161,50 @@ class DrawingToolsManager:
         return None
 
     def _merge_settings(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge global settings with tool-specific settings and provided kwargs."""
-        merged = {
-            "size": self.brush_size,
-            "color": self.brush_color,
-            "zoom_level": self.zoom_level,
-            "show_grid": self.show_grid,
-            "canvas_size": self.canvas_size,
-        }
+        """Merge global settings with tool-specific settings and provided kwargs.
+
+        The result may be the cached merge itself and must not be modified.
+        """
+        # The global and tool settings only change between strokes, so their
+        # merge is kept and reused until one of them differs
+        state = (
+            self.current_tool_name,
+            self.brush_size,
+            self.brush_color,
+            self.zoom_level,
+            self.show_grid,
+            self.canvas_size,
+        )
+        if state != self._merged_state:
+            base = {
+                "size": self.brush_size,
+                "color": self.brush_color,
+                "zoom_level": self.zoom_level,
+                "show_grid": self.show_grid,
+                "canvas_size": self.canvas_size,
+            }
 
-        # Add tool-specific settings (but don't override global color)
-        tool_settings = self.tool_settings.get(self.current_tool_name, {})
-        for key, value in tool_settings.items():
-            if (
-                key != "color"
-            ):  # Don't let tool-specific color override global brush color
-                merged[key] = value
+            # Add tool-specific settings (but don't override global color)
+            tool_settings = self.tool_settings.get(self.current_tool_name, {})
+            for key, value in tool_settings.items():
+                if (
+                    key != "color"
+                ):  # Don't let tool-specific color override global brush color
+                    base[key] = value
 
-        # Special handling for text tool: map font_size to size if size not provided
-        if (
-            self.current_tool_name == "text"
-            and "font_size" in merged
-            and "size" not in kwargs
-        ):
-            merged["size"] = merged["font_size"]
+            # Special handling for text tool: map font_size to size (kwargs
+            # below can still override it)
+            if self.current_tool_name == "text" and "font_size" in base:
+                base["size"] = base["font_size"]
 
-        # Override with provided kwargs
-        merged.update(kwargs)
+            self._merged_base = base
+            self._merged_state = state
 
-        return merged
+        # Callers only unpack the result with **, so the cached merge can be
+        # handed out as is when there is nothing to override
+        if not kwargs:
+            return self._merged_base
+        return {**self._merged_base, **kwargs}
 
     # Settings management
     def get_tool_settings(self, tool_name: str) -> Dict[str, Any]:
@@ -186,6 +215,7 @@ class DrawingToolsManager:
         """Set a specific setting for a tool."""
         if tool_name not in self.tool_settings:
             self.tool_settings[tool_name] = {}
+        self._merged_state = None
 
         # Validate setting with tool
         tool = ToolRegistry.get_tool(tool_name)
@@ -249,3 +279,4 @@ class DrawingToolsManager:
         tool = ToolRegistry.get_tool(tool_name)
         if tool:
             tool.cursor = cursor
+            ToolRegistry.refresh_tool_info(tool_name)
@@ -2,8 +2,10 @@
 Image management functionality using the unified core.
 """
 
+import atexit
+import shutil
 import tempfile
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 from PIL import Image, ImageTk
 
@@ -20,15 +22,44 @@ class ImageManager:
         self.original_images: Dict[str, Image.Image] = {}
         self.base_images: Dict[str, Image.Image] = {}
         self.current_rotations: Dict[str, int] = {}
-        self.image_previews: Dict[str, ImageTk.PhotoImage] = {}
+        self._image_previews: Dict[str, ImageTk.PhotoImage] = {}
         self.selected_image: Optional[str] = None
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir: Optional[str] = None
+        # Names whose preview must be rebuilt before it is next handed out
+        self._dirty_previews: Set[str] = set()
+
+    @property
+    def temp_dir(self) -> str:
+        """Scratch directory for this manager, created on first use."""
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp()
+            atexit.register(shutil.rmtree, self._temp_dir, ignore_errors=True)
+        return self._temp_dir
+
+    @property
+    def image_previews(self) -> Dict[str, ImageTk.PhotoImage]:
+        """Previews of all images by name, with out-of-date ones rebuilt first."""
+        for name in list(self._dirty_previews):
+            self._build_preview(name)
+        return self._image_previews
+
+    def cleanup_temp_dir(self) -> None:
+        """Remove the scratch directory if it was ever created."""
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
 
     def add_image(self, name: str, image: Image.Image) -> None:
-        """Add a new image to the manager."""
+        """Add a new image to the manager.
+
+        The image itself becomes the current one and may be drawn on in place.
+        The original and base entries share a single snapshot copy, which the
+        manager never modifies.
+        """
         self.current_images[name] = image
-        self.original_images[name] = image.copy()
-        self.base_images[name] = image.copy()
+        snapshot = image.copy()
+        self.original_images[name] = snapshot
+        self.base_images[name] = snapshot
         self.current_rotations[name] = 0
         self.update_preview(name)
 
@@ -64,24 +95,40 @@ class ImageManager:
             raise RuntimeError(f"Failed to apply transformations: {e}")
 
     def update_preview(self, name: str) -> None:
-        """Update the preview for an image using the unified core."""
+        """Mark an image's preview as out of date.
+
+        The thumbnail is rebuilt when the preview is next requested, so a run
+        of transformations between reads costs one thumbnail, not one each.
+        """
+        if name in self.current_images:
+            self._dirty_previews.add(name)
+
+    def _build_preview(self, name: str) -> None:
+        """Rebuild the preview for an image using the unified core."""
+        self._dirty_previews.discard(name)
         if name not in self.current_images:
             return
 
         try:
-            # Use unified core for thumbnail creation
             image = self.current_images[name]
-            preview_image = create_thumbnail(image, (64, 64))
+            if max(image.size) <= 64:
+                # Already small enough; copied so later in-place drawing on the
+                # image cannot show through a headless (PIL image) preview
+                preview_image = image.copy()
+            else:
+                # Use unified core for thumbnail creation
+                preview_image = create_thumbnail(image, (64, 64))
 
             # Convert to PhotoImage - handle case where no tkinter root exists
             try:
-                self.image_previews[name] = ImageTk.PhotoImage(preview_image)
+                preview = ImageTk.PhotoImage(preview_image)
             except RuntimeError as e:
                 if "no default root window" in str(e):
                     # In testing or headless environment, store the PIL image instead
-                    self.image_previews[name] = preview_image
+                    preview = preview_image
                 else:
                     raise
+            self._image_previews[name] = preview
         except Exception as e:
             print(f"Warning: Failed to update preview for {name}: {e}")
 
@@ -91,25 +138,18 @@ class ImageManager:
 
     def get_preview(self, name: str) -> Optional[ImageTk.PhotoImage]:
         """Get a preview image by name."""
-        return self.image_previews.get(name)
+        if name in self._dirty_previews:
+            self._build_preview(name)
+        return self._image_previews.get(name)
 
     def list_images(self) -> list[str]:
         """Get list of all image names."""
         return list(self.current_images.keys())
 
-    def remove_image(self, name: str) -> None:
-        """Remove an image from the manager."""
-        if name in self.current_images:
-            del self.current_images[name]
-            del self.original_images[name]
-            del self.base_images[name]
-            del self.current_rotations[name]
-            if name in self.image_previews:
-                del self.image_previews[name]
-
     def reset_image(self, name: str) -> None:
         """Reset an image to its original state."""
         if name in self.original_images:
+            # Copy so drawing on the reset image leaves the snapshot intact
             self.current_images[name] = self.original_images[name].copy()
             self.current_rotations[name] = 0
             self.update_preview(name)
@@ -120,32 +160,25 @@ class ImageManager:
             self.current_images,
             self.original_images,
             self.base_images,
-            self.image_previews,
+            self._image_previews,
         ]:
             storage.pop(name, None)
 
         self.current_rotations.pop(name, None)
+        self._dirty_previews.discard(name)
 
         if self.selected_image == name:
             self.selected_image = None
 
-    def get_image(self, name: str) -> Optional[Image.Image]:
-        """Get an image by name."""
-        return self.current_images.get(name)
-
-    def get_preview(self, name: str) -> Optional[ImageTk.PhotoImage]:
-        """Get a preview image by name."""
-        return self.image_previews.get(name)
-
-    def list_images(self) -> list:
-        """Get list of all image names."""
-        return list(self.current_images.keys())
-
     def clear_all(self) -> None:
-        """Clear all images."""
-        self.current_images.clear()
-        self.original_images.clear()
-        self.base_images.clear()
-        self.current_rotations.clear()
-        self.image_previews.clear()
+        """Clear all images and previews in one pass."""
+        for storage in (
+            self.current_images,
+            self.original_images,
+            self.base_images,
+            self.current_rotations,
+            self._image_previews,
+            self._dirty_previews,
+        ):
+            storage.clear()
         self.selected_image = None
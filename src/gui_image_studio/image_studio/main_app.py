@@ -5,16 +5,20 @@ A visual tool for developers to design images/icons and generate embedded code.
 Features detachable left and right panels with fixed width.
 """
 
+import atexit
 import base64
-import gc
 import json
+import math
 import os
 import tempfile
+import threading
 import tkinter as tk
-from collections import Counter
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from tkinter import colorchooser, filedialog, messagebox, simpledialog, ttk
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Optional memory monitoring
 try:
@@ -32,7 +36,7 @@ from threepanewindows import (  # type: ignore[import]
 
 from gui_image_studio.embedded_icons import cleanup_icon, get_icon_path
 
-from .core.canvas_manager import CanvasManager
+from .core.canvas_manager import CanvasManager, image_pixels, zoom_nearest
 from .core.drawing_tools import DrawingToolsManager
 
 # Import refactored components
@@ -41,6 +45,85 @@ from .ui.dialogs import CodePreviewWindow, HelpWindow, ImageSizeDialog
 from .ui.menu import MenuManager
 from .ui.panels import PanelManager
 
+# Cache key for preview photos: (image name, id(image), edit version, (width, height))
+PreviewKey = Tuple[str, int, int, Tuple[int, int]]
+
+# Cursors to fall back on for each tool when the preferred one is unavailable
+_CURSOR_FALLBACKS: Dict[str, Tuple[str, ...]] = {
+    "brush": ("crosshair", "pencil", "dotbox"),
+    "pencil": ("crosshair", "pencil", "dotbox"),
+    "eraser": ("dotbox", "crosshair"),
+    "line": ("crosshair", "plus"),
+    "rectangle": ("crosshair", "plus"),
+    "circle": ("crosshair", "plus"),
+    "text": ("xterm", "ibeam"),
+    "fill": ("spraycan", "crosshair"),
+}
+_DEFAULT_CURSOR_FALLBACKS = ("crosshair", "arrow")
+
+# Embedded pane icons extracted to disk, shared by every window in the process
+_ICON_CACHE: Dict[str, Optional[str]] = {}
+_ICON_LOCK = threading.Lock()
+
+
+def _cleanup_cached_icons() -> None:
+    """Remove the extracted pane icons when the interpreter exits."""
+    with _ICON_LOCK:
+        for icon_path in _ICON_CACHE.values():
+            cleanup_icon(icon_path)
+        _ICON_CACHE.clear()
+
+
+def _cached_icon_path(icon_name: str) -> Optional[str]:
+    """Return the on-disk path of an embedded icon, extracting it only once."""
+    with _ICON_LOCK:
+        if icon_name not in _ICON_CACHE:
+            if not _ICON_CACHE:
+                atexit.register(_cleanup_cached_icons)
+            _ICON_CACHE[icon_name] = get_icon_path(icon_name)
+        return _ICON_CACHE[icon_name]
+
+
+def _write_settings_file(settings_file: str, text: str) -> None:
+    """Write a settings file via a temporary file so it is never left truncated."""
+    tmp_file = settings_file + ".tmp"
+    try:
+        with open(tmp_file, "w") as f:
+            f.write(text)
+        os.replace(tmp_file, settings_file)
+    except (PermissionError, OSError) as e:
+        print(f"Warning: Could not save cursor settings: {e}")
+    except Exception as e:
+        print(f"Warning: Unexpected error saving cursor settings: {e}")
+
+
+@lru_cache(maxsize=512)
+def _format_display_name(name: str, max_length: int) -> str:
+    """Truncate an image name for preview labels, adding an ellipsis if cut."""
+    if len(name) > max_length:
+        return name[:max_length] + "..."
+    return name
+
+
+def _png_base64(image: Image.Image, quality: int, compress_level: int = 6) -> str:
+    """Encode an image as base64 PNG text for embedding in generated code."""
+    buffer = BytesIO()
+    image.save(buffer, format="PNG", quality=quality, compress_level=compress_level)
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def _filter_colour_bands(image: Image.Image, image_filter) -> Image.Image:
+    """Apply a filter to the colour bands only, carrying the alpha band over.
+
+    Detail filters have no meaning for transparency, and running them over the
+    alpha band costs a quarter of the work (EMBOSS even turns opaque alpha to 128).
+    """
+    if image.mode != "RGBA":
+        return image.filter(image_filter)
+    filtered = image.convert("RGB").filter(image_filter)
+    filtered.putalpha(image.getchannel("A"))
+    return filtered
+
 
 class EnhancedImageDesignerGUI:
     """Main GUI application for image design and code generation."""
@@ -60,7 +143,8 @@ class EnhancedImageDesignerGUI:
             {}
         )  # Store base images (before rotation)
         self.current_rotations: Dict[str, int] = {}  # Track current rotation angles
-        self.image_previews: Dict[str, ImageTk.PhotoImage] = {}
+        # Canvas photos of recently shown images, oldest first
+        self.image_previews: "OrderedDict[str, ImageTk.PhotoImage]" = OrderedDict()
         self.selected_image: Optional[str] = None
         self.temp_dir = tempfile.mkdtemp()
 
@@ -76,6 +160,7 @@ class EnhancedImageDesignerGUI:
         # UI widgets (will be set during UI setup)
         self.canvas: Optional[tk.Canvas] = None
         self.image_listbox: Optional[tk.Listbox] = None
+        self._listbox_index: Dict[str, int] = {}  # Image name -> listbox row
         self.color_button: Optional[tk.Button] = None
         self.preview_canvas: Optional[tk.Canvas] = None
         self.grid_var: Optional[tk.BooleanVar] = None
@@ -83,8 +168,8 @@ class EnhancedImageDesignerGUI:
 
         # Drawing state variables
         self.drawing = False
-        self.last_x = 0
-        self.last_y = 0
+        self.last_x: Optional[int] = None  # None until a stroke starts
+        self.last_y: Optional[int] = None
         self.start_x = 0
         self.start_y = 0
         self.preview_shape = None
@@ -92,18 +177,61 @@ class EnhancedImageDesignerGUI:
         self.pixel_highlight = None
         self.last_highlight_pos = None
 
+        # Preview canvas size, kept current by its <Configure> binding
+        self._preview_dims: Tuple[int, int] = (1, 1)
+
+        # Set while a coalesced preview refresh is queued for the next idle cycle
+        self._preview_pending = False
+
+        # Per-image edit counters and the inputs of the last preview drawn,
+        # used to skip preview refreshes that would redraw the same thing
+        self._image_versions: Dict[str, int] = {}
+        self._preview_state: Optional[tuple] = None
+
+        # Pixel array of the image last zoomed for display, kept for view-only
+        # redraws and keyed by (name, id, edit counter)
+        self._zoom_pixels: Any = None
+        self._zoom_pixels_key: Optional[Tuple[str, int, int]] = None
+
+        # (name, id, edit counter, display size) each canvas photo last showed,
+        # so switching back to a recently shown image reuses its photo as is
+        self._canvas_photo_keys: Dict[str, tuple] = {}
+
+        # Recently used preview photos shared by all preview modes
+        self._photo_cache: "OrderedDict[PreviewKey, ImageTk.PhotoImage]" = OrderedDict()
+
+        # Image-space box touched since the last canvas update, and the canvas
+        # item showing the current image, for partial redraws while stroking
+        self._dirty_bbox: Optional[Tuple[int, int, int, int]] = None
+        self._canvas_image_item: Optional[int] = None
+        # (name, image id, version, zoom, grid) last drawn on the canvas
+        self._last_canvas_state: Optional[tuple] = None
+        self._patch_photo: Optional[ImageTk.PhotoImage] = None
+
+        # Set while a coalesced canvas redraw is queued for the next idle cycle
+        self._redraw_pending = False
+
+        # Canvas centre the welcome instructions were last laid out around
+        self._instructions_center: Optional[Tuple[int, int]] = None
+
+        # Worker threads for PNG encoding, created on first export
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
+        # Pending debounced cursor settings save, and the last background write
+        self._settings_save_job: Optional[str] = None
+        self._settings_write: Optional[Future] = None
+
+        # Transparent grid overlay, rebuilt only when its (size, spacing) changes
+        self._grid_photo: Optional[ImageTk.PhotoImage] = None
+        self._grid_key: Optional[Tuple[Tuple[int, int], int]] = None
+
         # Code generation variables
         self.quality_var = tk.IntVar(value=95)
         self.framework_var = tk.StringVar(value="tkinter")
         self.usage_var = tk.StringVar(value="general")
 
         # Add trace callbacks to update preview when settings change
-        self.framework_var.trace("w", lambda *args: self.update_preview())
-        self.usage_var.trace("w", lambda *args: self.update_preview())
-        self.quality_var.trace("w", lambda *args: self.update_preview())
-
-        # Icon paths for cleanup
-        self.icon_paths: List[str] = []
+        self._watch_preview_settings()
 
         # Initialize managers first
         self.image_manager = ImageManager()
@@ -112,9 +240,6 @@ class EnhancedImageDesignerGUI:
         self.menu_manager = MenuManager(self)
         self.panel_manager = PanelManager(self)
 
-        # Drawing state (initialize drawing tools grid setting)
-        self.drawing_tools.show_grid = False
-
         # Cursor settings - copied from original
         self.cursor_settings = {
             "handedness": "right",  # 'left' or 'right'
@@ -131,6 +256,9 @@ class EnhancedImageDesignerGUI:
 
         self.tool_buttons = {}  # Dictionary to store tool button references
 
+        # Cursor that worked for each (tool, preferred cursor), tried first
+        self._cursor_known_good: Dict[Tuple[str, str], str] = {}
+
         # Load cursor settings from file if exists
         self.load_cursor_settings()
 
@@ -144,7 +272,7 @@ class EnhancedImageDesignerGUI:
         # Initialize UI state
         self.update_ui_state()
         self.update_canvas()  # Show initial instructions
-        self.update_preview()  # Show initial preview
+        self._schedule_preview()  # Show initial preview
 
         # Center the window on the desktop
         self.center_window()
@@ -207,12 +335,9 @@ class EnhancedImageDesignerGUI:
         self.setup_button_styles()
 
         # Configure pane configurations with embedded icons
-        tools_icon = get_icon_path("tools")
-        canvas_icon = get_icon_path("canvas")
-        settings_icon = get_icon_path("settings")
-
-        # Track icon paths for cleanup
-        self.icon_paths.extend([tools_icon, canvas_icon, settings_icon])
+        tools_icon = _cached_icon_path("tools")
+        canvas_icon = _cached_icon_path("canvas")
+        settings_icon = _cached_icon_path("settings")
 
         left_config = PaneConfig(
             title="Tools & Images",
@@ -292,9 +417,8 @@ class EnhancedImageDesignerGUI:
         # Restore the selected image if there was one
         if self.selected_image and hasattr(self, "image_listbox"):
             try:
-                items = list(self.current_images.keys())
-                if self.selected_image in items:
-                    index = items.index(self.selected_image)
+                index = self._listbox_index.get(self.selected_image)
+                if index is not None:
                     self.image_listbox.selection_clear(0, tk.END)
                     self.image_listbox.selection_set(index)
                     self.image_listbox.see(index)
@@ -308,6 +432,8 @@ class EnhancedImageDesignerGUI:
     def build_right_panel(self, parent) -> None:
         """Build the right panel with properties and code generation."""
         self.panel_manager.setup_right_panel(parent)
+        # The panel creates fresh setting variables, so trace those instead
+        self._watch_preview_settings()
         # Restore the right panel state after it's been rebuilt (detach/reattach)
         self.root.after_idle(self._restore_right_panel_state)
 
@@ -324,7 +450,7 @@ class EnhancedImageDesignerGUI:
                 self.name_var.set(self.selected_image)
 
         # Update the preview
-        self.update_preview()
+        self._schedule_preview()
 
     def setup_bindings(self):
         """Setup keyboard and mouse bindings."""
@@ -424,45 +550,35 @@ class EnhancedImageDesignerGUI:
                 except tk.TclError:
                     pass  # Fall back to default options
 
-        # Define fallback options for each tool based on platform and handedness
-        fallback_options = self.get_cursor_fallback_options(tool)
-
-        # Try the preferred cursor first, then fallbacks
-        cursors_to_try = [preferred_cursor] + fallback_options
-
-        # Remove duplicates while preserving order
-        seen = set()
-        cursors_to_try = [x for x in cursors_to_try if not (x in seen or seen.add(x))]
+        # Reuse the cursor that worked last time for this choice
+        key = (tool, preferred_cursor)
+        known_good = self._cursor_known_good.get(key)
+        if known_good is not None:
+            try:
+                self.canvas.configure(cursor=known_good)
+                return
+            except tk.TclError:
+                pass  # Fall back to trying each option again
 
-        # Try each cursor option until one works
+        # Try the preferred cursor first, then fallbacks, then arrow (in order,
+        # without duplicates) until one works
+        cursors_to_try = dict.fromkeys(
+            (preferred_cursor, *self.get_cursor_fallback_options(tool), "arrow")
+        )
         for cursor in cursors_to_try:
             try:
                 self.canvas.configure(cursor=cursor)
+                self._cursor_known_good[key] = cursor
                 return  # Success, exit the method
             except tk.TclError:
                 continue  # Try the next cursor
 
-        # If all cursors fail, use arrow as final fallback
-        try:
-            self.canvas.configure(cursor="arrow")
-        except tk.TclError:
-            pass  # Give up if even arrow fails
-
-    def get_cursor_fallback_options(self, tool):
-        """Get fallback cursor options based on tool, platform, and handedness."""
-        # Base options for each tool
-        base_options = {
-            "brush": ["crosshair", "pencil", "dotbox"],
-            "pencil": ["crosshair", "pencil", "dotbox"],
-            "eraser": ["dotbox", "crosshair"],
-            "line": ["crosshair", "plus"],
-            "rectangle": ["crosshair", "plus"],
-            "circle": ["crosshair", "plus"],
-            "text": ["xterm", "ibeam"],
-            "fill": ["spraycan", "crosshair"],
-        }
+    def get_cursor_fallback_options(self, tool) -> Tuple[str, ...]:
+        """Get fallback cursor options based on tool, platform, and handedness.
 
-        return base_options.get(tool, ["crosshair", "arrow"])
+        The returned tuple is shared between calls.
+        """
+        return _CURSOR_FALLBACKS.get(tool, _DEFAULT_CURSOR_FALLBACKS)
 
     def load_cursor_settings(self):
         """Load cursor settings from file."""
@@ -485,19 +601,40 @@ class EnhancedImageDesignerGUI:
             )
 
     def save_cursor_settings(self):
-        """Save cursor settings to file."""
+        """Save cursor settings to file.
+
+        Saves are debounced: several changes in quick succession are written
+        once, half a second after the last one, on the I/O worker pool.
+        """
+        if self._settings_save_job is not None:
+            self.root.after_cancel(self._settings_save_job)
+        self._settings_save_job = self.root.after(500, self._flush_cursor_settings)
+
+    def _flush_cursor_settings(self, wait: bool = False):
+        """Write pending cursor settings, replacing the file atomically."""
+        self._settings_save_job = None
         try:
-            settings_file = os.path.join(
-                os.path.expanduser("~"), ".gui_image_studio_cursors.json"
-            )
-            with open(settings_file, "w") as f:
-                json.dump(self.cursor_settings, f, indent=2)
-        except (PermissionError, OSError) as e:
-            print(f"Warning: Could not save cursor settings: {e}")
+            # Serialise here so the worker never sees settings mid-change
+            text = json.dumps(self.cursor_settings, indent=2)
         except (TypeError, ValueError) as e:
             print(f"Warning: Invalid cursor settings data: {e}")
-        except Exception as e:
-            print(f"Warning: Unexpected error saving cursor settings: {e}")
+            return
+
+        settings_file = os.path.join(
+            os.path.expanduser("~"), ".gui_image_studio_cursors.json"
+        )
+        previous = self._settings_write
+        if wait:
+            if previous is not None:
+                previous.result()
+            _write_settings_file(settings_file, text)
+        elif previous is not None and not previous.done():
+            # Keep writes in order by retrying once the last one has finished
+            self.save_cursor_settings()
+        else:
+            self._settings_write = self._get_io_pool().submit(
+                _write_settings_file, settings_file, text
+            )
 
     def reset_cursor_settings(self):
         """Reset cursor settings to defaults."""
@@ -554,21 +691,76 @@ class EnhancedImageDesignerGUI:
         # Placeholder for UI state updates
         pass
 
-    def update_canvas(self):
-        """Update the canvas display."""
+    def _schedule_redraw(self):
+        """Queue a canvas redraw, collapsing repeated requests into one."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Run a queued canvas redraw unless one already happened meanwhile."""
+        if self._redraw_pending:
+            self.update_canvas()
+
+    def update_canvas(self, content_changed: bool = True):
+        """Update the canvas display.
+
+        Pass ``content_changed=False`` for view-only changes (zoom, grid,
+        selection) so the image's cached previews stay valid.
+        """
+        # A stroke redraw still queued means the pixels changed regardless
+        content_changed = content_changed or self._redraw_pending
+        self._redraw_pending = False
+
         # Clear any active preview shapes and pixel highlights
         if hasattr(self, "canvas_manager"):
             self.canvas_manager.clear_preview()
             self.canvas_manager.clear_pixel_highlight()
 
-        if not self.selected_image:
-            # Clear canvas and show instructions
+        name = self.selected_image
+        if not name:
+            # Show instructions (this clears the canvas unless they are already up)
             if hasattr(self, "canvas"):
-                self.canvas.delete("all")
                 self.show_canvas_instructions()
             return
 
-        image = self.current_images[self.selected_image]
+        image = self.current_images[name]
+
+        # Every edit ends with a canvas update, so drop stale preview photos here
+        if content_changed:
+            self._invalidate_preview_cache(name)
+
+        # A stroke that only touched a small region is re-blitted in place
+        dirty, self._dirty_bbox = self._dirty_bbox, None
+        if dirty is not None and self._blit_dirty_region(name, image, dirty):
+            # The blit leaves the whole photo current for this edit
+            photo = self.image_previews[name]
+            self._canvas_photo_keys[name] = (
+                name,
+                id(image),
+                self._image_versions.get(name, 0),
+                (photo.width(), photo.height()),
+            )
+            if hasattr(self, "preview_canvas"):
+                self._schedule_preview()
+            return
+
+        # View-only updates that would redraw exactly what is shown are skipped
+        zoom = self.drawing_tools.get_zoom_level()
+        state = (
+            name,
+            id(image),
+            self._image_versions.get(name, 0),
+            zoom,
+            self.drawing_tools.show_grid,
+        )
+        if (
+            not content_changed
+            and state == self._last_canvas_state
+            and self._canvas_shows(name)
+        ):
+            return
+        self._last_canvas_state = None
 
         # Check if image is too large to process safely
         max_image_size = 4096  # Maximum original image dimension
@@ -586,17 +778,8 @@ class EnhancedImageDesignerGUI:
                 )
             return
 
-        # Clean up old PhotoImage to prevent memory leaks
-        if self.selected_image in self.image_previews:
-            old_photo = self.image_previews[self.selected_image]
-            # Force garbage collection of the old PhotoImage
-            del old_photo
-
         # Create display image with zoom
-        display_size = (
-            int(image.width * self.drawing_tools.get_zoom_level()),
-            int(image.height * self.drawing_tools.get_zoom_level()),
-        )
+        display_size = (int(image.width * zoom), int(image.height * zoom))
 
         # Limit maximum display size to prevent memory issues
         max_display_size = 2048  # Maximum dimension in pixels
@@ -611,14 +794,38 @@ class EnhancedImageDesignerGUI:
             )
 
         try:
-            display_image = image.resize(display_size, Image.NEAREST)
-
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(display_image)
-            self.image_previews[self.selected_image] = photo
+            version = self._image_versions.get(name, 0)
+            photo = self.image_previews.get(name)
+            if photo is not None:
+                self.image_previews.move_to_end(name)
+            photo_key = (name, id(image), version, display_size)
+
+            # Skip the zoom when the photo already shows these pixels at this size
+            if photo is None or photo_key != self._canvas_photo_keys.get(name):
+                pixels = None
+                if zoom >= 3 and zoom == int(zoom):
+                    # Whole-number zooms repeat the pixel array, so keep it
+                    # between redraws that only change the view
+                    key = (name, id(image), version)
+                    if key != self._zoom_pixels_key:
+                        self._zoom_pixels = image_pixels(image)
+                        self._zoom_pixels_key = key
+                    pixels = self._zoom_pixels
+                display_image = zoom_nearest(image, display_size, pixels)
+
+                # Reuse this image's PhotoImage when the display size is
+                # unchanged, updating the Tk image in place instead of
+                # allocating a new one
+                photo_size = None if photo is None else (photo.width(), photo.height())
+                if photo_size == display_size:
+                    photo.paste(display_image)
+                else:
+                    photo = ImageTk.PhotoImage(display_image)
+                    self._set_canvas_photo(name, photo)
+                self._canvas_photo_keys[name] = photo_key
 
-            # Clean up the temporary display_image to free memory
-            del display_image
+                # Clean up the temporary display_image to free memory
+                del display_image
 
         except MemoryError:
             # Handle memory error gracefully
@@ -649,51 +856,144 @@ class EnhancedImageDesignerGUI:
                 )
             return
 
-        # Clear and update canvas
+        # Update the canvas, keeping the image item while it is still there
         if hasattr(self, "canvas"):
-            self.canvas.delete("all")
-            self.canvas.create_image(10, 10, anchor=tk.NW, image=photo)
+            item = self._canvas_image_item
+            if item is not None and self.canvas.type(item) == "image":
+                if self.canvas.itemcget(item, "image") != str(photo):
+                    self.canvas.itemconfigure(item, image=photo)
+            else:
+                self.canvas.delete("all")
+                self._canvas_image_item = self.canvas.create_image(
+                    10, 10, anchor=tk.NW, image=photo
+                )
 
             # Draw grid if enabled
-            if (
-                self.drawing_tools.show_grid
-                and self.drawing_tools.get_zoom_level() >= 4
-            ):
+            if self.drawing_tools.show_grid and zoom >= 4:
                 self.draw_grid(display_size)
+            else:
+                self.canvas.delete("grid")
 
             # Update scroll region
             self.canvas.configure(
                 scrollregion=(0, 0, display_size[0] + 20, display_size[1] + 20)
             )
+            self._last_canvas_state = state
 
         # Update preview when canvas changes
         if hasattr(self, "preview_canvas"):
-            self.root.after_idle(self.update_preview)
-
-        # Periodic memory cleanup (every 10th canvas update)
-        if not hasattr(self, "_cleanup_counter"):
-            self._cleanup_counter = 0
-        self._cleanup_counter += 1
-        if self._cleanup_counter >= 10:
-            self._cleanup_counter = 0
-            self.root.after_idle(self.cleanup_memory)
+            self._schedule_preview()
+
+    def _canvas_shows(self, name: str) -> bool:
+        """Check that the canvas image item still displays an image's photo."""
+        item = self._canvas_image_item
+        photo = self.image_previews.get(name)
+        if item is None or photo is None or self.canvas.type(item) != "image":
+            return False
+        return self.canvas.itemcget(item, "image") == str(photo)
+
+    def _set_canvas_photo(self, name: str, photo: ImageTk.PhotoImage) -> None:
+        """Store an image's canvas photo, dropping the least recently shown."""
+        self.image_previews[name] = photo
+        self.image_previews.move_to_end(name)
+        if len(self.image_previews) > 8:
+            evicted, _ = self.image_previews.popitem(last=False)
+            self._canvas_photo_keys.pop(evicted, None)
+
+    def _mark_dirty(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Grow the pending dirty box to include an image-space rectangle."""
+        if self._dirty_bbox is not None:
+            bx1, by1, bx2, by2 = self._dirty_bbox
+            x1, y1, x2, y2 = min(x1, bx1), min(y1, by1), max(x2, bx2), max(y2, by2)
+        self._dirty_bbox = (x1, y1, x2, y2)
+
+    def _blit_dirty_region(
+        self, name: str, image: Image.Image, bbox: Tuple[int, int, int, int]
+    ) -> bool:
+        """Copy just the dirty part of an image into its on-screen photo.
+
+        Returns False when a full redraw is needed instead, e.g. for fractional
+        zoom levels or when the canvas no longer shows this image's photo.
+        """
+        if not hasattr(self, "canvas") or self._canvas_image_item is None:
+            return False
+
+        zoom = self.drawing_tools.get_zoom_level()
+        scale = int(zoom)
+        if scale < 1 or scale != zoom:
+            return False
+
+        photo = self.image_previews.get(name)
+        if photo is None or (photo.width(), photo.height()) != (
+            image.width * scale,
+            image.height * scale,
+        ):
+            return False
+        if self.canvas.itemcget(self._canvas_image_item, "image") != str(photo):
+            return False
+        # The rest of the photo must already show this image object; the edit
+        # version is not compared, as it was bumped for this very stroke
+        key = self._canvas_photo_keys.get(name)
+        if key is None or key[1] != id(image):
+            return False
+
+        x1, y1 = max(0, bbox[0]), max(0, bbox[1])
+        x2, y2 = min(image.width, bbox[2]), min(image.height, bbox[3])
+        if x1 >= x2 or y1 >= y2:
+            return True  # Nothing visible changed
+
+        # Stage the unzoomed pixels in a scratch photo, reused while its size fits
+        region = image.crop((x1, y1, x2, y2))
+        patch = self._patch_photo
+        if patch is not None and (patch.width(), patch.height()) == region.size:
+            patch.paste(region)
+        else:
+            patch = self._patch_photo = ImageTk.PhotoImage(region)
+
+        # Tk does the zoom while copying, and "set" replaces pixels outright so
+        # erased (transparent) areas show up
+        self.root.tk.call(
+            str(photo),
+            "copy",
+            str(patch),
+            "-zoom",
+            scale,
+            scale,
+            "-to",
+            x1 * scale,
+            y1 * scale,
+            "-compositingrule",
+            "set",
+        )
+        return True
 
     def show_canvas_instructions(self):
         """Show instructions on empty canvas."""
-        if not hasattr(self, "canvas"):
+        if not hasattr(self, "canvas") or self.selected_image:
             return
 
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
 
         if canvas_width <= 1 or canvas_height <= 1:
-            # Canvas not yet initialized, schedule for later
-            self.root.after(100, self.show_canvas_instructions)
+            # Canvas not sized yet; its <Configure> binding will show them
             return
 
         center_x = canvas_width // 2
         center_y = canvas_height // 2
 
+        # The panel is only built when missing; a resize just re-centres it
+        previous = self._instructions_center
+        if previous is not None and self.canvas.find_withtag("instructions"):
+            if previous != (center_x, center_y):
+                self.canvas.move(
+                    "instructions", center_x - previous[0], center_y - previous[1]
+                )
+                self._instructions_center = (center_x, center_y)
+            return
+        self.canvas.delete("all")
+        self._instructions_center = (center_x, center_y)
+
         # Add background rectangle first (so it's behind the text)
         self.canvas.create_rectangle(
             center_x - 200,
@@ -767,23 +1067,30 @@ class EnhancedImageDesignerGUI:
             return
 
         grid_spacing = max(1, int(self.drawing_tools.get_zoom_level()))
-
-        # Draw vertical lines
-        for x in range(10, display_size[0] + 10, grid_spacing):
-            self.canvas.create_line(
-                x, 10, x, display_size[1] + 10, fill="#e0e0e0", width=1
-            )
-
-        # Draw horizontal lines
-        for y in range(10, display_size[1] + 10, grid_spacing):
-            self.canvas.create_line(
-                10, y, display_size[0] + 10, y, fill="#e0e0e0", width=1
+        key = ((display_size[0], display_size[1]), grid_spacing)
+
+        # Render the grid into one transparent image and reuse it across redraws
+        if key != self._grid_key:
+            width, height = key[0]
+            overlay = Image.new("RGBA", key[0], (0, 0, 0, 0))
+            line_color = (0xE0, 0xE0, 0xE0, 255)
+            for x in range(0, width, grid_spacing):
+                overlay.paste(line_color, (x, 0, x + 1, height))
+            for y in range(0, height, grid_spacing):
+                overlay.paste(line_color, (0, y, width, y + 1))
+            self._grid_photo = ImageTk.PhotoImage(overlay)
+            self._grid_key = key
+
+        # Point an existing grid item at the overlay rather than adding another
+        items = self.canvas.find_withtag("grid")
+        if items:
+            if self.canvas.itemcget(items[0], "image") != str(self._grid_photo):
+                self.canvas.itemconfigure(items[0], image=self._grid_photo)
+        else:
+            self.canvas.create_image(
+                10, 10, anchor=tk.NW, image=self._grid_photo, tags="grid"
             )
 
-    def cleanup_memory(self):
-        """Cleanup memory periodically."""
-        gc.collect()
-
     def on_image_select(self, event):
         """Handle image selection from listbox."""
         if hasattr(self, "image_listbox"):
@@ -794,13 +1101,13 @@ class EnhancedImageDesignerGUI:
 
     def select_image(self, name):
         """Select an image."""
-        if name in self.current_images:
+        image = self.current_images.get(name)
+        if image is not None:
             self.selected_image = name
-            self.update_canvas()
-            self.update_preview()
+            self.update_canvas(content_changed=False)
+            self._schedule_preview()
 
             # Update properties
-            image = self.current_images[name]
             if hasattr(self, "width_var"):
                 self.width_var.set(image.width)
             if hasattr(self, "height_var"):
@@ -811,10 +1118,9 @@ class EnhancedImageDesignerGUI:
             # Update listbox selection
             if hasattr(self, "image_listbox"):
                 try:
-                    # Find the index of the selected image
-                    items = list(self.current_images.keys())
-                    if name in items:
-                        index = items.index(name)
+                    # Find the listbox row of the selected image
+                    index = self._listbox_index.get(name)
+                    if index is not None:
                         self.image_listbox.selection_clear(0, tk.END)
                         self.image_listbox.selection_set(index)
                         self.image_listbox.see(index)
@@ -847,6 +1153,7 @@ class EnhancedImageDesignerGUI:
         if old_name in self.image_previews:
             self.image_previews[new_name] = self.image_previews[old_name]
             del self.image_previews[old_name]
+        self._forget_render_state(old_name)
 
         self.update_image_list()
         self.select_image(new_name)
@@ -868,7 +1175,16 @@ class EnhancedImageDesignerGUI:
         }
 
         self.drawing_tools.handle_click(image, x, y, **kwargs)
-        self.update_canvas()
+
+        # Stroke tools only paint within their size of the click; others (fill)
+        # may change any part of the image
+        tool = self.drawing_tools.get_current_tool_instance()
+        if tool is not None and tool.supports_drag():
+            pad = kwargs["size"] + 2
+            self._mark_dirty(x - pad, y - pad, x + pad, y + pad)
+        else:
+            self._mark_dirty(0, 0, image.width, image.height)
+        self._schedule_redraw()
 
     def draw_line_on_image(self, x1, y1, x2, y2):
         """Draw a line on the current image using the new tool system."""
@@ -881,7 +1197,13 @@ class EnhancedImageDesignerGUI:
         kwargs = {"size": self.size_var.get(), "root": self.root}
 
         self.drawing_tools.handle_drag(image, x1, y1, x2, y2, **kwargs)
-        self.update_canvas()
+
+        # Strokes stay within the brush size of the segment (spray included)
+        pad = kwargs["size"] + 2
+        self._mark_dirty(
+            min(x1, x2) - pad, min(y1, y2) - pad, max(x1, x2) + pad, max(y1, y2) + pad
+        )
+        self._schedule_redraw()
 
     def draw_shape(self, x1, y1, x2, y2):
         """Draw a shape on the current image using the new tool system."""
@@ -963,7 +1285,7 @@ class EnhancedImageDesignerGUI:
             return
 
         # Only highlight if position changed
-        if hasattr(self, "last_highlight_pos") and self.last_highlight_pos == (x, y):
+        if self.last_highlight_pos == (x, y):
             return
 
         self.last_highlight_pos = (x, y)
@@ -1000,11 +1322,90 @@ class EnhancedImageDesignerGUI:
         """Clear the pixel highlight from canvas."""
         if not hasattr(self, "canvas") or self.canvas is None:
             return
-        if hasattr(self, "pixel_highlight") and self.pixel_highlight:
+        if self.pixel_highlight:
             self.canvas.delete(self.pixel_highlight)
             self.pixel_highlight = None
-        if hasattr(self, "last_highlight_pos"):
-            self.last_highlight_pos = None
+        self.last_highlight_pos = None
+
+    def _invalidate_preview_cache(self, name):
+        """Discard cached preview photos for an image whose pixels may have changed."""
+        self._image_versions[name] = self._image_versions.get(name, 0) + 1
+        for key in [key for key in self._photo_cache if key[0] == name]:
+            del self._photo_cache[key]
+
+    def _forget_render_state(self, name):
+        """Drop every render cache entry for a deleted or renamed image.
+
+        The keys hold id(image), which a later image given the same name could
+        reuse, so nothing may survive that might then match its pixels.
+        """
+        self._invalidate_preview_cache(name)
+        self._image_versions.pop(name, None)
+        self._canvas_photo_keys.pop(name, None)
+        if self._zoom_pixels_key is not None and self._zoom_pixels_key[0] == name:
+            self._zoom_pixels = self._zoom_pixels_key = None
+
+    def _get_preview_photo(self, name, image, size):
+        """Get a resized preview PhotoImage for an image, reusing cached ones."""
+        cache_key = (name, id(image), self._image_versions.get(name, 0), size)
+        photo = self._photo_cache.get(cache_key)
+        if photo is None:
+            resized = image.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+            photo = ImageTk.PhotoImage(resized)
+            self._photo_cache[cache_key] = photo
+            if len(self._photo_cache) > 32:
+                self._photo_cache.popitem(last=False)
+        else:
+            self._photo_cache.move_to_end(cache_key)
+        return photo
+
+    def _watch_preview_settings(self) -> None:
+        """Queue a preview refresh when the framework or usage setting changes.
+
+        Quality only affects generated code, so dragging its slider is not
+        traced. Writes are coalesced by _schedule_preview.
+        """
+        for var in (self.framework_var, self.usage_var):
+            var.trace("w", lambda *args: self._schedule_preview())
+
+    def _schedule_preview(self, event=None):
+        """Queue a single preview refresh for the next idle cycle."""
+        if self._preview_pending:
+            return
+        self._preview_pending = True
+        self.root.after_idle(self._do_preview)
+
+    def _do_preview(self):
+        """Run a queued preview refresh unless it would draw the same thing."""
+        self._preview_pending = False
+        if self.preview_canvas is None or not self.preview_canvas.winfo_viewable():
+            return  # Refreshed by _on_preview_map once the canvas is shown
+
+        state = self._get_preview_state()
+        if state == self._preview_state:
+            return
+        self._preview_state = state
+        self.update_preview()
+
+    def _get_preview_state(self) -> tuple:
+        """Collect everything the preview depends on into a comparable tuple."""
+        framework = getattr(self, "framework_var", None)
+        usage = getattr(self, "usage_var", None)
+        return (
+            framework.get() if framework is not None else None,
+            usage.get() if usage is not None else None,
+            self._preview_dims,
+            self.selected_image,
+            tuple(
+                (name, id(image), self._image_versions.get(name, 0))
+                for name, image in self.current_images.items()
+            ),
+        )
+
+    def _on_preview_map(self, event):
+        """Redraw the preview whenever its canvas is (re)shown."""
+        self._preview_state = None
+        self._schedule_preview()
 
     def update_preview(self, event=None):
         """Update the live preview based on current settings."""
@@ -1054,8 +1455,7 @@ class EnhancedImageDesignerGUI:
     def _show_preview_placeholder(self, text, color="#888888"):
         """Show placeholder text in preview canvas."""
         try:
-            canvas_width = self.preview_canvas.winfo_width()
-            canvas_height = self.preview_canvas.winfo_height()
+            canvas_width, canvas_height = self._preview_dims
 
             if canvas_width <= 1:
                 # Canvas not ready, try again later
@@ -1078,6 +1478,15 @@ class EnhancedImageDesignerGUI:
         except Exception as e:
             print(f"Error showing placeholder: {e}")
 
+    def _on_canvas_configure(self, event):
+        """Lay out the welcome instructions when the empty canvas is resized."""
+        if not self.selected_image:
+            self.show_canvas_instructions()
+
+    def _on_preview_configure(self, event):
+        """Remember the preview canvas size when it is resized."""
+        self._preview_dims = (event.width, event.height)
+
     def _update_preview_scrollbar(self):
         """Update scrollbar visibility based on content."""
         try:
@@ -1090,7 +1499,7 @@ class EnhancedImageDesignerGUI:
 
                 # Check if scrollbar is needed
                 content_height = bbox[3] - bbox[1]
-                canvas_height = self.preview_canvas.winfo_height()
+                canvas_height = self._preview_dims[1]
 
                 if content_height > canvas_height - 10:  # Account for padding
                     # Show scrollbar if it exists
@@ -1117,7 +1526,7 @@ class EnhancedImageDesignerGUI:
                 bbox = self.preview_canvas.bbox("all")
                 if bbox:
                     content_height = bbox[3] - bbox[1]
-                    canvas_height = self.preview_canvas.winfo_height()
+                    canvas_height = self._preview_dims[1]
 
                     if content_height > canvas_height:
                         # Scroll the canvas
@@ -1168,7 +1577,7 @@ class EnhancedImageDesignerGUI:
         """Called when a drawing operation is completed."""
         try:
             # Update preview after drawing operations
-            self.update_preview()
+            self._schedule_preview()
         except Exception as e:
             print(f"Error updating preview after drawing: {e}")
 
@@ -1176,7 +1585,7 @@ class EnhancedImageDesignerGUI:
         """Called when an image is modified in any way."""
         try:
             # Update preview when image is modified
-            self.update_preview()
+            self._schedule_preview()
         except Exception as e:
             print(f"Error updating preview after image modification: {e}")
 
@@ -1222,17 +1631,9 @@ class EnhancedImageDesignerGUI:
             usage = self.usage_var.get()
             quality = self.quality_var.get()
 
-            # Generate embedded images dictionary
-            embedded_images = {}
-            for name, image in self.current_images.items():
-                # Convert to bytes
-                buffer = BytesIO()
-                image.save(buffer, format="PNG", quality=quality)
-                image_bytes = buffer.getvalue()
-
-                # Encode to base64
-                encoded = base64.b64encode(image_bytes).decode("utf-8")
-                embedded_images[name] = encoded
+            # Generate embedded images dictionary, encoding images in parallel.
+            # The preview is throwaway, so favour encode speed over PNG size.
+            embedded_images = self._encode_images(quality, compress_level=1)
 
             # Generate code based on framework and usage
             code = self._generate_code_content(embedded_images, framework, usage)
@@ -1243,6 +1644,26 @@ class EnhancedImageDesignerGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate code preview: {str(e)}")
 
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Return the worker pool used for image encoding and export."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                thread_name_prefix="image-io",
+            )
+        return self._io_pool
+
+    def _encode_images(self, quality: int, compress_level: int = 6) -> Dict[str, str]:
+        """Encode all current images to base64 PNG text, several at a time."""
+        names = list(self.current_images)
+        encoded = self._get_io_pool().map(
+            _png_base64,
+            self.current_images.values(),
+            [quality] * len(names),
+            [compress_level] * len(names),
+        )
+        return dict(zip(names, encoded))
+
     def _generate_code_content(self, embedded_images, framework, usage):
         """Generate the actual code content."""
         code = f"# Generated {framework} code for {usage}\n"
@@ -1397,14 +1818,8 @@ def display_image(parent, image_name, size=None):
             if not filename:
                 return
 
-            # Generate embedded images dictionary
-            embedded_images = {}
-            for name, image in self.current_images.items():
-                buffer = BytesIO()
-                image.save(buffer, format="PNG", quality=quality)
-                image_bytes = buffer.getvalue()
-                encoded = base64.b64encode(image_bytes).decode("utf-8")
-                embedded_images[name] = encoded
+            # Generate embedded images dictionary, encoding images in parallel
+            embedded_images = self._encode_images(quality)
 
             # Generate code
             code = self._generate_code_content(embedded_images, framework, usage)
@@ -1485,7 +1900,7 @@ def display_image(parent, image_name, size=None):
             blurred = image.filter(ImageFilter.GaussianBlur(radius=1))
             self.current_images[self.selected_image] = blurred
             self.update_canvas()
-            self.update_preview()
+            self._schedule_preview()
             messagebox.showinfo("Filter Applied", "Blur filter applied successfully!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to apply blur filter: {str(e)}")
@@ -1498,10 +1913,10 @@ def display_image(parent, image_name, size=None):
 
         try:
             image = self.current_images[self.selected_image]
-            sharpened = image.filter(ImageFilter.SHARPEN)
+            sharpened = _filter_colour_bands(image, ImageFilter.SHARPEN)
             self.current_images[self.selected_image] = sharpened
             self.update_canvas()
-            self.update_preview()
+            self._schedule_preview()
             messagebox.showinfo(
                 "Filter Applied", "Sharpen filter applied successfully!"
             )
@@ -1516,10 +1931,10 @@ def display_image(parent, image_name, size=None):
 
         try:
             image = self.current_images[self.selected_image]
-            embossed = image.filter(ImageFilter.EMBOSS)
+            embossed = _filter_colour_bands(image, ImageFilter.EMBOSS)
             self.current_images[self.selected_image] = embossed
             self.update_canvas()
-            self.update_preview()
+            self._schedule_preview()
             messagebox.showinfo("Filter Applied", "Emboss filter applied successfully!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to apply emboss filter: {str(e)}")
@@ -1598,7 +2013,7 @@ def display_image(parent, image_name, size=None):
 
             self.current_images[self.selected_image] = transparent_image
             self.update_canvas()
-            self.update_preview()
+            self._schedule_preview()
 
             messagebox.showinfo(
                 "Transparency Applied",
@@ -1705,7 +2120,7 @@ def display_image(parent, image_name, size=None):
 
             self.current_images[self.selected_image] = result_image
             self.update_canvas()
-            self.update_preview()
+            self._schedule_preview()
 
             # Calculate percentage removed
             total_pixels = len(data)
@@ -1785,7 +2200,7 @@ def display_image(parent, image_name, size=None):
             ) % 360
 
             self.update_canvas()
-            self.update_preview()
+            self._schedule_preview()
             messagebox.showinfo(
                 "Rotation Applied", f"Image rotated by {angle} degrees!"
             )
@@ -1812,7 +2227,7 @@ def display_image(parent, image_name, size=None):
                 self.update_rotation_display()
 
                 self.update_canvas()
-                self.update_preview()
+                self._schedule_preview()
                 messagebox.showinfo(
                     "Rotation Reset", "Image rotation reset to 0 degrees!"
                 )
@@ -1832,10 +2247,6 @@ def display_image(parent, image_name, size=None):
         pass  # Placeholder
 
     # Memory and performance methods
-    def cleanup_memory(self):
-        """Clean up memory usage."""
-        gc.collect()
-
     def check_memory_usage(self):
         """Check current memory usage."""
         if PSUTIL_AVAILABLE:
@@ -1927,7 +2338,7 @@ def display_image(parent, image_name, size=None):
                                 "RGB", export_image.size, (255, 255, 255)
                             )
                             background.paste(
-                                export_image, mask=export_image.split()[-1]
+                                export_image, mask=export_image
                             )  # Use alpha as mask
                             export_image = background
                         elif export_image.mode != "RGB":
@@ -1996,15 +2407,14 @@ def display_image(parent, image_name, size=None):
             return
 
         y_offset = 10
-        canvas_width = self.preview_canvas.winfo_width() or 200
+        canvas_width = self._preview_dims[0] or 200
 
         for i, (name, image) in enumerate(
             list(self.current_images.items())[:3]
         ):  # Show first 3
             try:
                 # Create a button preview
-                button_img = image.resize((32, 32), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(button_img)
+                photo = self._get_preview_photo(name, image, (32, 32))
 
                 # Create button-like background
                 bg_x1, bg_y1 = 10, y_offset - 16
@@ -2025,7 +2435,7 @@ def display_image(parent, image_name, size=None):
                 self.preview_canvas.create_text(
                     50,
                     y_offset,
-                    text=f"Button: {name[:15]}{'...' if len(name) > 15 else ''}",
+                    text=f"Button: {_format_display_name(name, 15)}",
                     anchor="w",
                     font=("Arial", 8),
                 )
@@ -2061,10 +2471,7 @@ def display_image(parent, image_name, size=None):
                 y = y_offset + row * spacing_y
 
                 # Create icon
-                icon_img = image.resize(
-                    (icon_size, icon_size), Image.Resampling.LANCZOS
-                )
-                photo = ImageTk.PhotoImage(icon_img)
+                photo = self._get_preview_photo(name, image, (icon_size, icon_size))
 
                 # Create icon background
                 self.preview_canvas.create_rectangle(
@@ -2083,7 +2490,7 @@ def display_image(parent, image_name, size=None):
                 self.preview_canvas.create_text(
                     x + icon_size // 2,
                     y + icon_size + 5,
-                    text=name[:8] + ("..." if len(name) > 8 else ""),
+                    text=_format_display_name(name, 8),
                     anchor="n",
                     font=("Arial", 7),
                     fill="#666666",
@@ -2112,13 +2519,12 @@ def display_image(parent, image_name, size=None):
             else:
                 name, image = next(iter(self.current_images.items()))
 
-            canvas_width = self.preview_canvas.winfo_width() or 200
+            canvas_width = self._preview_dims[0] or 200
             bg_width = min(canvas_width - 20, 150)
             bg_height = int(bg_width * 0.6)  # 3:2 aspect ratio
 
             # Create background preview
-            bg_img = image.resize((bg_width, bg_height), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(bg_img)
+            photo = self._get_preview_photo(name, image, (bg_width, bg_height))
 
             # Create frame around background
             frame_x1, frame_y1 = 10, 10
@@ -2142,7 +2548,7 @@ def display_image(parent, image_name, size=None):
             self.preview_canvas.create_text(
                 10,
                 frame_y2 + 10,
-                text=f"Background: {name[:20]}{'...' if len(name) > 20 else ''}",
+                text=f"Background: {_format_display_name(name, 20)}",
                 anchor="w",
                 font=("Arial", 9),
                 fill="#333333",
@@ -2177,8 +2583,8 @@ def display_image(parent, image_name, size=None):
         if not hasattr(self, "preview_canvas"):
             return
 
-        canvas_width = self.preview_canvas.winfo_width() or 200
-        canvas_height = self.preview_canvas.winfo_height() or 100
+        canvas_width = self._preview_dims[0] or 200
+        canvas_height = self._preview_dims[1] or 100
 
         # Get framework name
         framework = self.framework_var.get()
@@ -2257,10 +2663,9 @@ def display_image(parent, image_name, size=None):
             try:
                 # Scale sprite appropriately for the scene
                 max_sprite_size = min(scene_width // 3, scene_height // 2, 64)
-                sprite_img = image.resize(
-                    (max_sprite_size, max_sprite_size), Image.Resampling.LANCZOS
+                photo = self._get_preview_photo(
+                    name, image, (max_sprite_size, max_sprite_size)
                 )
-                photo = ImageTk.PhotoImage(sprite_img)
 
                 # Place the selected sprite in the center of the scene
                 sprite_x = scene_x + (scene_width - photo.width()) // 2
@@ -2283,8 +2688,8 @@ def display_image(parent, image_name, size=None):
         if not hasattr(self, "preview_canvas"):
             return
 
-        canvas_width = self.preview_canvas.winfo_width() or 200
-        canvas_height = self.preview_canvas.winfo_height() or 100
+        canvas_width = self._preview_dims[0] or 200
+        canvas_height = self._preview_dims[1] or 100
 
         # Get framework name
         framework = self.framework_var.get()
@@ -2320,37 +2725,41 @@ def display_image(parent, image_name, size=None):
         )
 
         # Place images as toolbar icons with proper spacing
-        icon_x = ui_x + 8
-        toolbar_images = 0
+        icon_size = 24
+        icon_step = icon_size + 8
         max_toolbar_images = max(4, min(8, len(self.current_images)))
 
         try:
-            for i, (name, image) in enumerate(
-                list(self.current_images.items())[:max_toolbar_images]
-            ):
-                if toolbar_images >= max_toolbar_images:
-                    break
-
-                # Create toolbar icon (24x24)
-                icon_size = 24
-                icon_img = image.resize(
-                    (icon_size, icon_size), Image.Resampling.LANCZOS
+            # Work out how many icons fit in the toolbar up front
+            fit_count = (ui_width - icon_size - 24) // icon_step + 1
+            toolbar_items = list(self.current_images.items())[
+                : max(0, min(max_toolbar_images, fit_count))
+            ]
+            toolbar_images = len(toolbar_items)
+
+            if toolbar_items:
+                # Composite the equally sized icons into one strip so the whole
+                # toolbar is a single PhotoImage and a single canvas item
+                strip = Image.new(
+                    "RGBA", (toolbar_images * icon_step - 8, icon_size), (0, 0, 0, 0)
                 )
-                photo = ImageTk.PhotoImage(icon_img)
-
-                if icon_x + icon_size + 8 > ui_x + ui_width - 8:
-                    break  # Don't overflow toolbar
+                for i, (name, image) in enumerate(toolbar_items):
+                    icon_img = image.resize(
+                        (icon_size, icon_size),
+                        Image.Resampling.LANCZOS,
+                        reducing_gap=2.0,
+                    )
+                    strip.paste(icon_img, (i * icon_step, 0))
+                photo = ImageTk.PhotoImage(strip)
 
-                # Center icon vertically in toolbar
+                # Center icons vertically in toolbar
                 icon_y = ui_y + (toolbar_height - icon_size) // 2
                 self.preview_canvas.create_image(
-                    icon_x, icon_y, image=photo, anchor="nw"
+                    ui_x + 8, icon_y, image=photo, anchor="nw"
                 )
 
                 # Keep reference
                 self._preview_refs.append(photo)
-                icon_x += icon_size + 8
-                toolbar_images += 1
 
             # Main content area
             content_y = ui_y + toolbar_height + 10
@@ -2376,35 +2785,30 @@ def display_image(parent, image_name, size=None):
                     content_images_shown = 0
                     max_content_images = min(6, len(remaining_images))
 
-                    for name, image in remaining_images[:max_content_images]:
-                        # Create content icon (32x32)
-                        content_icon_size = 32
-                        content_img = image.resize(
-                            (content_icon_size, content_icon_size),
-                            Image.Resampling.LANCZOS,
-                        )
-                        photo = ImageTk.PhotoImage(content_img)
+                    # Loop-invariant layout values for the content icons (32x32)
+                    content_icon_size = 32
+                    content_step = content_icon_size + 10
+                    row_limit = ui_x + ui_width - 10
+                    content_bottom = content_y + content_height - 10
 
-                        if (
-                            content_icon_x + content_icon_size + 10
-                            > ui_x + ui_width - 10
-                        ):
+                    for name, image in remaining_images[:max_content_images]:
+                        if content_icon_x + content_step > row_limit:
                             content_icon_x = ui_x + 10
-                            content_icon_y += content_icon_size + 10
+                            content_icon_y += content_step
 
-                        if (
-                            content_icon_y + content_icon_size
-                            > content_y + content_height - 10
-                        ):
+                        if content_icon_y + content_icon_size > content_bottom:
                             break  # Don't overflow content area
 
+                        photo = self._get_preview_photo(
+                            name, image, (content_icon_size, content_icon_size)
+                        )
                         self.preview_canvas.create_image(
                             content_icon_x, content_icon_y, image=photo, anchor="nw"
                         )
 
                         # Keep reference
                         self._preview_refs.append(photo)
-                        content_icon_x += content_icon_size + 10
+                        content_icon_x += content_step
                         content_images_shown += 1
 
                     # Add text if there's space
@@ -2439,12 +2843,11 @@ def display_image(parent, image_name, size=None):
 
             # Create general preview
             preview_width, preview_height = 80, 60
-            prev_img = image.resize(
-                (preview_width, preview_height), Image.Resampling.LANCZOS
+            photo = self._get_preview_photo(
+                name, image, (preview_width, preview_height)
             )
-            photo = ImageTk.PhotoImage(prev_img)
 
-            canvas_width = self.preview_canvas.winfo_width() or 200
+            canvas_width = self._preview_dims[0] or 200
             center_x = canvas_width // 2
 
             # Create image frame
@@ -2467,7 +2870,7 @@ def display_image(parent, image_name, size=None):
             self.preview_canvas.create_text(
                 center_x,
                 frame_y + preview_height + 10,
-                text=f"{name[:15]}{'...' if len(name) > 15 else ''}",
+                text=_format_display_name(name, 15),
                 anchor="n",
                 font=("Arial", 9, "bold"),
                 fill="#333333",
@@ -2527,7 +2930,7 @@ def display_image(parent, image_name, size=None):
 
             self.update_image_list()
             self.select_image(name)
-            self.update_preview()
+            self._schedule_preview()
 
     def load_image(self):
         """Load an image from file."""
@@ -2576,10 +2979,9 @@ def display_image(parent, image_name, size=None):
                     image.copy()
                 )  # Store base image (before rotation)
                 self.current_rotations[name] = 0  # Initialize rotation angle
-                self.cleanup_memory()  # Clean up before updating UI
                 self.update_image_list()
                 self.select_image(name)
-                self.update_preview()
+                self._schedule_preview()
 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load image: {str(e)}")
@@ -2596,15 +2998,31 @@ def display_image(parent, image_name, size=None):
             return
 
         try:
-            for name, image in self.current_images.items():
-                image_path = os.path.join(output_dir, f"{name}.png")
-                image.save(image_path, "PNG")
-
-            messagebox.showinfo("Success", f"Images exported to: {output_dir}")
+            # Save copies in the background so editing can continue meanwhile
+            pool = self._get_io_pool()
+            futures = [
+                pool.submit(
+                    image.copy().save, os.path.join(output_dir, f"{name}.png"), "PNG"
+                )
+                for name, image in self.current_images.items()
+            ]
+            self._watch_export(futures, output_dir)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export images: {str(e)}")
 
+    def _watch_export(self, futures: List[Future], output_dir: str):
+        """Report the result of an export once all background saves finish."""
+        if not all(future.done() for future in futures):
+            self.root.after(100, self._watch_export, futures, output_dir)
+            return
+
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            messagebox.showerror("Error", f"Failed to export images: {str(errors[0])}")
+        else:
+            messagebox.showinfo("Success", f"Images exported to: {output_dir}")
+
     def resize_image(self):
         """Resize the current image."""
         if not self.selected_image:
@@ -2626,7 +3044,7 @@ def display_image(parent, image_name, size=None):
         self.update_base_image()
 
         self.update_canvas()
-        self.update_preview()
+        self._schedule_preview()
 
     def update_base_image(self):
         """Update base image after resize."""
@@ -2644,22 +3062,34 @@ def display_image(parent, image_name, size=None):
         self.canvas_manager.clear_canvas()
 
     # View operations
+    # Zoom levels are whole multiples (1x-10x) or whole divisors (1/2-1/10) so
+    # they never drift and integer zooms map each image pixel to an NxN block
     def zoom_in(self):
         """Zoom in on the canvas."""
         current_zoom = self.drawing_tools.get_zoom_level()
-        self.drawing_tools.set_zoom_level(min(current_zoom * 1.5, 10.0))
-        self.update_canvas()
+        if current_zoom >= 1:
+            new_zoom = float(min(int(current_zoom) + 1, 10))
+        else:
+            divisor = math.ceil(round(1 / current_zoom, 6))
+            new_zoom = 1 / max(1, divisor - 1)
+        self.drawing_tools.set_zoom_level(new_zoom)
+        self.update_canvas(content_changed=False)
 
     def zoom_out(self):
         """Zoom out on the canvas."""
         current_zoom = self.drawing_tools.get_zoom_level()
-        self.drawing_tools.set_zoom_level(max(current_zoom / 1.5, 0.1))
-        self.update_canvas()
+        if current_zoom > 1:
+            new_zoom = float(math.ceil(current_zoom) - 1)
+        else:
+            divisor = math.floor(round(1 / current_zoom, 6))
+            new_zoom = 1 / min(divisor + 1, 10)
+        self.drawing_tools.set_zoom_level(new_zoom)
+        self.update_canvas(content_changed=False)
 
     def reset_zoom(self):
         """Reset zoom to 100%."""
         self.drawing_tools.set_zoom_level(1.0)
-        self.update_canvas()
+        self.update_canvas(content_changed=False)
 
     def fit_to_window(self):
         """Fit canvas to window."""
@@ -2672,7 +3102,7 @@ def display_image(parent, image_name, size=None):
             self.drawing_tools.show_grid = self.grid_var.get()
         else:
             self.drawing_tools.show_grid = not self.drawing_tools.show_grid
-        self.update_canvas()
+        self.update_canvas(content_changed=False)
 
     # Settings
     def open_cursor_settings(self):
@@ -2752,7 +3182,7 @@ def display_image(parent, image_name, size=None):
 
             self.update_image_list()
             self.select_image(new_name)
-            self.update_preview()
+            self._schedule_preview()
 
     def delete_image(self):
         """Delete the selected image."""
@@ -2773,10 +3203,14 @@ def display_image(parent, image_name, size=None):
                     del self.current_rotations[name]
                 if name in self.image_previews:
                     del self.image_previews[name]
+                self._forget_render_state(name)
 
                 # Clear selection if this was the selected image
                 self.selected_image = None
 
+                # Refresh the list first so the row index matches the listbox
+                self.update_image_list()
+
                 # Select another image if available
                 if self.current_images:
                     first_image = next(iter(self.current_images.keys()))
@@ -2785,8 +3219,7 @@ def display_image(parent, image_name, size=None):
                     # No images left, clear canvas
                     self.update_canvas()
 
-                self.update_image_list()
-                self.update_preview()
+                self._schedule_preview()
 
     def zoom_fit(self):
         """Fit image to canvas."""
@@ -2801,8 +3234,16 @@ def display_image(parent, image_name, size=None):
             if canvas_width > 0 and canvas_height > 0:
                 zoom_x = canvas_width / image.width
                 zoom_y = canvas_height / image.height
-                self.drawing_tools.set_zoom_level(min(zoom_x, zoom_y, 10.0))
-                self.update_canvas()
+                zoom = min(zoom_x, zoom_y, 10.0)
+
+                # Snap down onto the integer zoom ladder used by zoom_in/zoom_out
+                if zoom >= 1:
+                    zoom = float(int(zoom))
+                else:
+                    # ...and never below the 1/10 floor zoom_out stops at
+                    zoom = 1 / min(math.ceil(round(1 / zoom, 6)), 10)
+                self.drawing_tools.set_zoom_level(zoom)
+                self.update_canvas(content_changed=False)
 
     def on_name_change(self, event):
         """Handle name change in properties."""
@@ -2842,6 +3283,7 @@ def display_image(parent, image_name, size=None):
         if old_name in self.image_previews:
             self.image_previews[new_name] = self.image_previews[old_name]
             del self.image_previews[old_name]
+        self._forget_render_state(old_name)
 
         # Update selected image
         if self.selected_image == old_name:
@@ -2874,7 +3316,7 @@ def display_image(parent, image_name, size=None):
                 self.update_base_image()
 
                 self.update_canvas()
-                self.update_preview()
+                self._schedule_preview()
 
             except (tk.TclError, ValueError):
                 messagebox.showerror("Error", "Invalid size values")
@@ -2903,16 +3345,17 @@ def display_image(parent, image_name, size=None):
         """Update the image list display."""
         if hasattr(self, "image_listbox"):
             self.image_listbox.delete(0, tk.END)
-            for name in self.current_images.keys():
+            self._listbox_index = {}
+            for index, name in enumerate(self.current_images.keys()):
                 self.image_listbox.insert(tk.END, name)
+                self._listbox_index[name] = index
 
             # Also update the image manager to keep it in sync
             if hasattr(self, "image_manager"):
                 try:
-                    # Clear and repopulate image manager
-                    current_manager_images = self.image_manager.list_images()
-                    for name in current_manager_images:
-                        self.image_manager.remove_image(name)
+                    # Clear and repopulate image manager; images are drawn
+                    # on in place, so cached previews cannot be kept
+                    self.image_manager.clear_all()
                     for name, image in self.current_images.items():
                         self.image_manager.add_image(name, image)
                 except Exception as e:
@@ -2946,19 +3389,14 @@ def display_image(parent, image_name, size=None):
 
     def on_closing(self):
         """Handle application closing."""
-        # Cleanup temporary files and icons
+        # Cleanup temporary files (pane icons are removed at exit)
         try:
             import shutil
 
             if hasattr(self, "temp_dir"):
                 shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-            if hasattr(self.image_manager, "temp_dir"):
-                shutil.rmtree(self.image_manager.temp_dir, ignore_errors=True)
-
-            # Cleanup embedded icons
-            for icon_path in self.icon_paths:
-                cleanup_icon(icon_path)
+            self.image_manager.cleanup_temp_dir()
         except (OSError, IOError, PermissionError) as e:
             # Log cleanup errors but don't prevent application from closing
             print(f"Warning: Cleanup error during application shutdown: {e}")
@@ -2966,8 +3404,14 @@ def display_image(parent, image_name, size=None):
             # Catch any other unexpected errors during cleanup
             print(f"Warning: Unexpected error during cleanup: {e}")
 
-        # Force garbage collection
-        gc.collect()
+        # Write cursor settings still waiting on the save debounce
+        if self._settings_save_job is not None:
+            self.root.after_cancel(self._settings_save_job)
+            self._flush_cursor_settings(wait=True)
+
+        # Let any export in progress finish writing its files
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
 
         self.root.destroy()
 
@@ -8,7 +8,14 @@ import glob
 import importlib
 import os
 
-from .base_tool import BaseTool, ToolRegistry, register_tool
+from .base_tool import (
+    BaseTool,
+    ToolRegistry,
+    get_draw,
+    parse_color,
+    register_tool,
+    release_draw,
+)
 
 
 def _auto_discover_tools():
@@ -47,4 +54,11 @@ def _auto_discover_tools():
 _discovered_tools = _auto_discover_tools()
 
 # Export the registry and base classes
-__all__ = ["BaseTool", "ToolRegistry", "register_tool"] + _discovered_tools
+__all__ = [
+    "BaseTool",
+    "ToolRegistry",
+    "get_draw",
+    "parse_color",
+    "register_tool",
+    "release_draw",
+] + _discovered_tools
@@ -3,9 +3,65 @@ Base tool interface for drawing tools.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
-from PIL import Image, ImageDraw
+from PIL import Image, ImageColor, ImageDraw
+
+
+@lru_cache(maxsize=128)
+def _hex_to_rgba(color: str) -> Tuple[int, int, int, int]:
+    """Decode a '#rrggbb' string (or any other PIL colour string) into RGBA."""
+    if len(color) != 7:
+        # Short and '#rrggbbaa' forms are left to PIL, as they always were
+        return ImageColor.getcolor(color, "RGBA")
+    hex_color = color[1:]
+    r, g, b = (int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+    return (r, g, b, 255)
+
+
+def parse_color(color: Any, default: Tuple[int, int, int, int] = (0, 0, 0, 255)) -> Any:
+    """Convert a '#' colour string to an RGBA tuple, passing other values through.
+
+    Decoded colours are cached, so the brush colour is parsed once per change
+    rather than on every tool event. Malformed hex strings yield ``default``.
+    """
+    if not (isinstance(color, str) and color.startswith("#")):
+        # Tuples and colour names go to PIL unchanged, as they always did
+        return color
+    try:
+        return _hex_to_rgba(color)
+    except (ValueError, IndexError):
+        return default
+
+
+# The last (image, core image, draw) triple handed out by get_draw
+_draw_cache: Optional[Tuple[Image.Image, Any, ImageDraw.ImageDraw]] = None
+
+
+def get_draw(image: Image.Image) -> ImageDraw.ImageDraw:
+    """Return an ImageDraw for an image, reusing the previous one if possible.
+
+    Successive events of a stroke target the same image, so they share one
+    drawing context instead of constructing a new one per mouse event.
+    """
+    global _draw_cache
+    cached = _draw_cache
+    if cached is not None and cached[0] is image and cached[1] is image.im:
+        return cached[2]
+    draw = ImageDraw.Draw(image)
+    _draw_cache = (image, image.im, draw)
+    return draw
+
+
+def release_draw() -> None:
+    """Forget the cached ImageDraw once a stroke ends.
+
+    The draw holds its image, so keeping it past the stroke would keep a
+    deleted or replaced image alive.
+    """
+    global _draw_cache
+    _draw_cache = None
 
 
 class BaseTool(ABC):
@@ -89,11 +145,45 @@ class ToolRegistry:
     """Registry for self-registering tools."""
 
     _tools: Dict[str, BaseTool] = {}
+    _info: Dict[str, Dict[str, Any]] = {}  # Display info snapshot per tool
+    _version = 0  # Bumped on every registration so callers can cache lookups
 
     @classmethod
     def register(cls, tool: BaseTool) -> None:
         """Register a tool."""
         cls._tools[tool.name] = tool
+        cls._info[tool.name] = cls._snapshot_info(tool)
+        cls._version += 1
+
+    @staticmethod
+    def _snapshot_info(tool: BaseTool) -> Dict[str, Any]:
+        """Collect the display information for a tool."""
+        return {
+            "name": tool.name,
+            "display_name": tool.display_name,
+            "description": tool.get_description(),
+            "icon": tool.get_icon(),
+            "cursor": tool.cursor,
+            "supports_preview": tool.supports_preview(),
+        }
+
+    @classmethod
+    def get_tool_info(cls, name: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a tool's display information, taken at registration."""
+        info = cls._info.get(name)
+        return dict(info) if info is not None else None
+
+    @classmethod
+    def refresh_tool_info(cls, name: str) -> None:
+        """Retake a tool's display information after its attributes change."""
+        tool = cls._tools.get(name)
+        if tool is not None:
+            cls._info[name] = cls._snapshot_info(tool)
+
+    @classmethod
+    def get_version(cls) -> int:
+        """Get a counter that changes whenever the set of tools changes."""
+        return cls._version
 
     @classmethod
     def get_tool(cls, name: str) -> Optional[BaseTool]:
@@ -4,9 +4,9 @@ Brush tool implementation.
 
 from typing import Any, Dict, Optional
 
-from PIL import Image, ImageDraw
+from PIL import Image
 
-from .base_tool import BaseTool, register_tool
+from .base_tool import BaseTool, get_draw, parse_color, register_tool
 
 
 @register_tool
@@ -27,9 +27,9 @@ class BrushTool(BaseTool):
 
     def on_click(self, image: Image.Image, x: int, y: int, **kwargs) -> None:
         """Handle single click - draw a circle."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         size = kwargs.get("size", self.settings["size"])
-        color = kwargs.get("color", "#000000")  # Use passed color or default black
+        color = parse_color(kwargs.get("color", "#000000"))  # Default black
 
         # Draw circle at click position
         draw.ellipse(
@@ -40,9 +40,9 @@ class BrushTool(BaseTool):
         self, image: Image.Image, x1: int, y1: int, x2: int, y2: int, **kwargs
     ) -> None:
         """Handle drag - draw line between points."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         size = kwargs.get("size", self.settings["size"])
-        color = kwargs.get("color", "#000000")  # Use passed color or default black
+        color = parse_color(kwargs.get("color", "#000000"))  # Default black
 
         # Draw line between drag points
         draw.line([x1, y1, x2, y2], fill=color, width=size)
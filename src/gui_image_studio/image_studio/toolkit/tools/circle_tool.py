@@ -4,9 +4,9 @@ Circle tool implementation.
 
 from typing import Any, Dict, Optional
 
-from PIL import Image, ImageDraw
+from PIL import Image
 
-from .base_tool import BaseTool, register_tool
+from .base_tool import BaseTool, get_draw, parse_color, register_tool
 
 
 @register_tool
@@ -45,7 +45,7 @@ class CircleTool(BaseTool):
         self, image: Image.Image, x1: int, y1: int, x2: int, y2: int, **kwargs
     ) -> None:
         """Handle mouse release - draw the final circle."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         width = kwargs.get("width", self.settings["width"])
         color = kwargs.get("color", "#000000")  # Use passed color or default black
         fill = kwargs.get("fill", self.settings["fill"])
@@ -53,15 +53,7 @@ class CircleTool(BaseTool):
         perfect_circle = kwargs.get("perfect_circle", self.settings["perfect_circle"])
 
         # Convert hex color to RGBA tuple for PIL
-        try:
-            if color.startswith("#"):
-                hex_color = color[1:]
-                rgba_color = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-                rgba_color = rgba_color + (255,)  # Add alpha channel
-            else:
-                rgba_color = color
-        except (ValueError, IndexError):
-            rgba_color = (0, 0, 0, 255)  # Default to black
+        rgba_color = parse_color(color)
 
         # Calculate circle bounds
         left = min(x1, x2)
@@ -90,17 +82,7 @@ class CircleTool(BaseTool):
         if right > left and bottom > top:
             if fill:
                 # Convert fill color
-                try:
-                    if fill_color.startswith("#"):
-                        hex_fill = fill_color[1:]
-                        rgba_fill = tuple(
-                            int(hex_fill[i : i + 2], 16) for i in (0, 2, 4)
-                        )
-                        rgba_fill = rgba_fill + (255,)
-                    else:
-                        rgba_fill = fill_color
-                except (ValueError, IndexError):
-                    rgba_fill = (255, 255, 255, 255)  # Default to white
+                rgba_fill = parse_color(fill_color, (255, 255, 255, 255))
 
                 # Draw filled circle
                 draw.ellipse(
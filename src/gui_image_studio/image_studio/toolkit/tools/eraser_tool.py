@@ -4,9 +4,9 @@ Eraser tool implementation.
 
 from typing import Any, Dict, Optional
 
-from PIL import Image, ImageDraw
+from PIL import Image
 
-from .base_tool import BaseTool, register_tool
+from .base_tool import BaseTool, get_draw, register_tool
 
 
 @register_tool
@@ -30,7 +30,7 @@ class EraserTool(BaseTool):
 
     def on_click(self, image: Image.Image, x: int, y: int, **kwargs) -> None:
         """Handle single click - erase a circle."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         size = kwargs.get("size", self.settings["size"])
 
         # Erase (draw transparent)
@@ -43,7 +43,7 @@ class EraserTool(BaseTool):
         self, image: Image.Image, x1: int, y1: int, x2: int, y2: int, **kwargs
     ) -> None:
         """Handle drag - erase line between points."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         size = kwargs.get("size", self.settings["size"])
 
         # Erase line between drag points
@@ -6,7 +6,71 @@ from typing import Any, Dict, Optional
 
 from PIL import Image, ImageDraw
 
-from .base_tool import BaseTool, register_tool
+from .base_tool import BaseTool, parse_color, register_tool
+
+# Try to import numpy, use fallback if not available
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def _scanline_flood_fill(
+    image: Image.Image, x: int, y: int, fill_color: tuple, thresh: int
+) -> None:
+    """Contiguous flood fill matching ``ImageDraw.floodfill`` semantics.
+
+    The tolerance mask is computed with NumPy in one pass and the connected
+    region is then walked span by span, so the Python-level work scales with
+    the number of spans rather than the number of pixels.
+    """
+    width, height = image.size
+    if not (0 <= x < width and 0 <= y < height):
+        return
+
+    pixels = np.asarray(image, dtype=np.int16)
+    background = pixels[y, x]
+    seed_diff = np.abs(np.asarray(fill_color, dtype=np.int16) - background).sum()
+    if seed_diff <= thresh:
+        return  # Seed point already has the fill colour
+
+    # Pixels close enough to the seed colour (1-norm, as PIL does)
+    similar = np.abs(pixels - background).sum(axis=2) <= thresh
+    rows = [bytearray(row) for row in similar.view(np.uint8)]
+    filled = np.zeros((height, width), dtype=np.uint8)
+
+    stack = [(x, y)]
+    while stack:
+        sx, sy = stack.pop()
+        row = rows[sy]
+        if not row[sx]:
+            continue
+
+        # Expand to the full run of similar pixels on this row
+        left = row.rfind(0, 0, sx) + 1
+        right = row.find(0, sx)
+        if right == -1:
+            right = width
+        row[left:right] = bytes(right - left)
+        filled[sy, left:right] = 255
+
+        # Queue the start of every similar run touching this span above/below
+        for ny in (sy - 1, sy + 1):
+            if not 0 <= ny < height:
+                continue
+            neighbour = rows[ny]
+            pos = neighbour.find(1, left, right)
+            while pos != -1:
+                stack.append((pos, ny))
+                pos = neighbour.find(0, pos, right)
+                if pos == -1:
+                    break
+                pos = neighbour.find(1, pos, right)
+
+    mask = Image.frombuffer("L", (width, height), filled.tobytes(), "raw", "L", 0, 1)
+    image.paste(fill_color, (0, 0, width, height), mask)
 
 
 @register_tool
@@ -35,16 +99,8 @@ class FillTool(BaseTool):
         tolerance = kwargs.get("tolerance", self.settings["tolerance"])
         contiguous = kwargs.get("contiguous", self.settings["contiguous"])
 
-        # Convert hex color to RGB tuple
-        try:
-            if color.startswith("#"):
-                hex_color = color[1:]
-                rgb_color = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-                rgba_color = rgb_color + (255,)  # Add alpha
-            else:
-                rgba_color = color
-        except (ValueError, IndexError):
-            rgba_color = (0, 0, 0, 255)  # Default to black
+        # Convert hex color to RGBA tuple
+        rgba_color = parse_color(color)
 
         # Perform flood fill
         try:
@@ -52,7 +108,10 @@ class FillTool(BaseTool):
                 # Standard flood fill with tolerance
                 # Convert tolerance from 0-100 scale to 0-255 scale for PIL
                 thresh = int((tolerance / 100.0) * 255)
-                ImageDraw.floodfill(image, (x, y), rgba_color, thresh=thresh)
+                if HAS_NUMPY and image.mode == "RGBA" and len(rgba_color) == 4:
+                    _scanline_flood_fill(image, x, y, rgba_color, thresh)
+                else:
+                    ImageDraw.floodfill(image, (x, y), rgba_color, thresh=thresh)
             else:
                 # Non-contiguous fill: replace all pixels of the same color
                 self._non_contiguous_fill(image, x, y, rgba_color, tolerance)
@@ -72,6 +131,10 @@ class FillTool(BaseTool):
         """Handle mouse release - no action for fill tool."""
         pass
 
+    def supports_drag(self) -> bool:
+        """Fill tool doesn't support dragging."""
+        return False
+
     def _non_contiguous_fill(
         self, image: Image.Image, x: int, y: int, fill_color: tuple, tolerance: int
     ) -> None:
@@ -97,6 +160,15 @@ class FillTool(BaseTool):
         # Convert tolerance from 0-100 scale to actual color difference
         tolerance_value = int((tolerance / 100.0) * 255)
 
+        if HAS_NUMPY and image.mode == "RGBA" and len(fill_color) == 4:
+            # Same max-channel RGB comparison, evaluated for every pixel at once
+            rgb = np.asarray(image, dtype=np.int16)[..., :3]
+            diff = np.abs(rgb - np.asarray(target_color[:3], dtype=np.int16))
+            similar = diff.max(axis=2) <= tolerance_value
+            mask = Image.fromarray(similar.astype(np.uint8) * 255, "L")
+            image.paste(fill_color, (0, 0) + image.size, mask)
+            return
+
         # Get image data
         width, height = image.size
         pixels = image.load()
@@ -4,9 +4,9 @@ Line tool implementation.
 
 from typing import Any, Dict, Optional
 
-from PIL import Image, ImageDraw
+from PIL import Image
 
-from .base_tool import BaseTool, register_tool
+from .base_tool import BaseTool, get_draw, parse_color, register_tool
 
 
 @register_tool
@@ -43,20 +43,12 @@ class LineTool(BaseTool):
         self, image: Image.Image, x1: int, y1: int, x2: int, y2: int, **kwargs
     ) -> None:
         """Handle mouse release - draw the final line."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         width = kwargs.get("width", self.settings["width"])
         color = kwargs.get("color", "#000000")  # Use passed color or default black
 
         # Convert hex color to RGBA tuple for PIL
-        try:
-            if color.startswith("#"):
-                hex_color = color[1:]
-                rgba_color = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-                rgba_color = rgba_color + (255,)  # Add alpha channel
-            else:
-                rgba_color = color
-        except (ValueError, IndexError):
-            rgba_color = (0, 0, 0, 255)  # Default to black
+        rgba_color = parse_color(color)
 
         # Draw the line
         draw.line([x1, y1, x2, y2], fill=rgba_color, width=width)
@@ -4,9 +4,9 @@ Pencil tool implementation.
 
 from typing import Any, Dict, Optional
 
-from PIL import Image, ImageDraw
+from PIL import Image
 
-from .base_tool import BaseTool, register_tool
+from .base_tool import BaseTool, get_draw, parse_color, register_tool
 
 
 @register_tool
@@ -27,15 +27,19 @@ class PencilTool(BaseTool):
 
     def on_click(self, image: Image.Image, x: int, y: int, **kwargs) -> None:
         """Handle single click - draw a pixel or small circle."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         size = kwargs.get("size", self.settings["size"])
-        color = kwargs.get("color", "#000000")  # Use passed color or default black
+        color = parse_color(kwargs.get("color", "#000000"))  # Default black
         show_grid = kwargs.get("show_grid", False)
         zoom_level = kwargs.get("zoom_level", 1.0)
 
         if show_grid and zoom_level >= 4:
-            # Pixel-perfect mode - draw single pixel
-            draw.point((x, y), fill=color)
+            # Pixel-perfect mode - draw single pixel, writing RGBA pixels directly
+            if image.mode == "RGBA" and isinstance(color, tuple):
+                if 0 <= x < image.width and 0 <= y < image.height:
+                    image.load()[x, y] = color
+            else:
+                draw.point((x, y), fill=color)
         else:
             # Normal pencil mode - small circle
             pencil_size = max(1, size // 2) if size > 1 else 1
@@ -53,9 +57,9 @@ class PencilTool(BaseTool):
         self, image: Image.Image, x1: int, y1: int, x2: int, y2: int, **kwargs
     ) -> None:
         """Handle drag - draw thin line between points."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         size = kwargs.get("size", self.settings["size"])
-        color = kwargs.get("color", "#000000")  # Use passed color or default black
+        color = parse_color(kwargs.get("color", "#000000"))  # Default black
         show_grid = kwargs.get("show_grid", False)
         zoom_level = kwargs.get("zoom_level", 1.0)
 
@@ -5,9 +5,9 @@ Spray paint tool implementation - example of adding a new tool.
 import random
 from typing import Any, Dict, Optional
 
-from PIL import Image, ImageDraw
+from PIL import Image
 
-from .base_tool import BaseTool, register_tool
+from .base_tool import BaseTool, get_draw, parse_color, register_tool
 
 
 @register_tool
@@ -55,21 +55,14 @@ class SprayTool(BaseTool):
 
     def _spray_paint(self, image: Image.Image, x: int, y: int, **kwargs) -> None:
         """Create spray paint effect at given position."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         size = kwargs.get("size", self.settings["size"])
         color = kwargs.get("color", "#000000")  # Use passed color or default black
         density = kwargs.get("density", self.settings["density"])
         pressure = kwargs.get("pressure", self.settings["pressure"])
 
-        # Convert hex color to RGB
-        try:
-            if color.startswith("#"):
-                hex_color = color[1:]
-                rgb_color = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-            else:
-                rgb_color = color
-        except (ValueError, IndexError):
-            rgb_color = (0, 0, 0)  # Default to black
+        # Convert hex color to RGBA
+        rgba_color = parse_color(color)
 
         # Calculate number of spray dots based on density
         num_dots = int((density / 100) * (size**2) / 10)
@@ -92,7 +85,7 @@ class SprayTool(BaseTool):
             # Draw spray dot
             try:
                 if dot_size == 1:
-                    draw.point((dot_x, dot_y), fill=rgb_color)
+                    draw.point((dot_x, dot_y), fill=rgba_color)
                 else:
                     draw.ellipse(
                         [
@@ -101,7 +94,7 @@ class SprayTool(BaseTool):
                             dot_x + dot_size // 2,
                             dot_y + dot_size // 2,
                         ],
-                        fill=rgb_color,
+                        fill=rgba_color,
                     )
             except (ValueError, IndexError):
                 # Skip dots that are outside image bounds
@@ -6,9 +6,9 @@ import tkinter as tk
 from tkinter import simpledialog
 from typing import Any, Dict, Optional
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageFont
 
-from .base_tool import BaseTool, register_tool
+from .base_tool import BaseTool, get_draw, parse_color, register_tool
 
 
 @register_tool
@@ -65,7 +65,7 @@ class TextTool(BaseTool):
         self, image: Image.Image, x: int, y: int, text: str, **kwargs
     ) -> None:
         """Draw text on the image."""
-        draw = ImageDraw.Draw(image)
+        draw = get_draw(image)
         font_size = kwargs.get("font_size", self.settings["font_size"])
         color = kwargs.get("color", "#000000")  # Use passed color or default black
         font_family = kwargs.get("font_family", self.settings["font_family"])
@@ -245,15 +245,7 @@ class TextTool(BaseTool):
                 font = None
 
         # Convert hex color to RGBA tuple for PIL
-        try:
-            if color.startswith("#"):
-                hex_color = color[1:]
-                rgba_color = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-                rgba_color = rgba_color + (255,)  # Add alpha channel
-            else:
-                rgba_color = color
-        except (ValueError, IndexError):
-            rgba_color = (0, 0, 0, 255)  # Default to black
+        rgba_color = parse_color(color)
 
         # Draw the text
         draw.text((x, y), text, fill=rgba_color, font=font)
@@ -83,3 +83,4 @@ class CenterPanel:
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         self.app.canvas = self.app.canvas_manager.create_canvas(canvas_frame)
+        self.app.canvas.bind("<Configure>", self.app._on_canvas_configure)
@@ -370,6 +370,8 @@ class RightPanel:
             preview_container, orient="vertical", command=self.app.preview_canvas.yview
         )
         self.app.preview_canvas.configure(yscrollcommand=self.app.preview_scrollbar.set)
+        self.app.preview_canvas.bind("<Configure>", self.app._on_preview_configure)
+        self.app.preview_canvas.bind("<Map>", self.app._on_preview_map)
 
         # Add tooltip to scrollbar
         self._create_tooltip(
@@ -386,8 +388,8 @@ class RightPanel:
         self.app.preview_scrollbar.pack_forget()
 
         # Bind framework/usage changes to update preview
-        framework_combo.bind("<<ComboboxSelected>>", self.app.update_preview)
-        usage_combo.bind("<<ComboboxSelected>>", self.app.update_preview)
+        framework_combo.bind("<<ComboboxSelected>>", self.app._schedule_preview)
+        usage_combo.bind("<<ComboboxSelected>>", self.app._schedule_preview)
 
     def _create_tooltip(self, widget, text):
         """Create a simple tooltip for a widget."""
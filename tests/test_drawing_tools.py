@@ -0,0 +1,124 @@
+"""
+Tests for the image studio drawing tools.
+
+These tests exercise the tools directly on PIL images, without a window.
+"""
+
+import random
+
+import pytest
+from PIL import Image, ImageDraw
+
+from gui_image_studio.image_studio.toolkit.tools import fill_tool, parse_color
+from gui_image_studio.image_studio.toolkit.tools.brush_tool import BrushTool
+
+FILL_COLOR = (10, 200, 30, 255)
+
+
+def _random_image(seed, size):
+    """Create an RGBA image of small colour patches with slight noise."""
+    rng = random.Random(seed)
+    palette = [(rng.randrange(256), rng.randrange(256), rng.randrange(256), 255)]
+    palette += [(255, 255, 255, 255), (250, 250, 250, 255), FILL_COLOR]
+    image = Image.new("RGBA", size)
+    image.putdata([rng.choice(palette) for _ in range(size[0] * size[1])])
+    return image
+
+
+class TestParseColor:
+    """Test colour parsing shared by the drawing tools."""
+
+    @pytest.mark.parametrize(
+        "color, expected",
+        [
+            ("#ff8000", (255, 128, 0, 255)),
+            ("#f00", (255, 0, 0, 255)),
+            ("#11223344", (17, 34, 51, 68)),
+        ],
+    )
+    def test_hex_colors(self, color, expected):
+        """Test that every hex form PIL accepts is decoded to RGBA."""
+        assert parse_color(color) == expected
+
+    @pytest.mark.parametrize("color", ["red", (255, 0, 0, 255), (0, 0, 255), 7])
+    def test_non_hex_colors_pass_through(self, color):
+        """Test that names, tuples and other values reach PIL unchanged."""
+        assert parse_color(color) == color
+
+    @pytest.mark.parametrize("color", ["#zzzzzz", "#12", "#gg0"])
+    def test_malformed_hex_uses_default(self, color):
+        """Test that malformed hex strings fall back to the default."""
+        assert parse_color(color) == (0, 0, 0, 255)
+        assert parse_color(color, (1, 2, 3, 4)) == (1, 2, 3, 4)
+
+    def test_brush_accepts_tuple_color(self):
+        """Test that a tool still draws with a tuple colour."""
+        image = Image.new("RGBA", (10, 10), (255, 255, 255, 255))
+        BrushTool().on_click(image, 5, 5, color=(255, 0, 0, 255), size=3)
+        assert image.getpixel((5, 5)) == (255, 0, 0, 255)
+
+
+class TestFillTool:
+    """Test the fill tool's NumPy paths against their reference versions."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        """Skip when NumPy, and so the fast paths, are not available."""
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize(
+        "seed, size, point, thresh",
+        [
+            (0, (24, 18), (5, 7), 0),
+            (1, (24, 18), (0, 0), 0),  # Corner seed
+            (2, (24, 18), (23, 17), 12),  # Opposite corner, with tolerance
+            (3, (31, 1), (10, 0), 0),  # Single row
+            (4, (1, 31), (0, 10), 20),  # Single column
+            (5, (40, 40), (20, 20), 255),
+            (6, (40, 40), (39, 0), 127),
+        ],
+    )
+    def test_scanline_flood_fill_matches_pil(self, seed, size, point, thresh):
+        """Test that the scanline fill reproduces ImageDraw.floodfill."""
+        image = _random_image(seed, size)
+        expected = image.copy()
+        ImageDraw.floodfill(expected, point, FILL_COLOR, thresh=thresh)
+
+        fill_tool._scanline_flood_fill(image, *point, FILL_COLOR, thresh)
+        assert image.tobytes() == expected.tobytes()
+
+    def test_scanline_flood_fill_seed_already_fill_color(self):
+        """Test that filling a region already in the fill colour changes nothing."""
+        image = Image.new("RGBA", (10, 10), FILL_COLOR)
+        image.putpixel((3, 3), (0, 0, 0, 255))
+        expected = image.copy()
+        ImageDraw.floodfill(expected, (0, 0), FILL_COLOR, thresh=0)
+
+        fill_tool._scanline_flood_fill(image, 0, 0, FILL_COLOR, 0)
+        assert image.tobytes() == expected.tobytes()
+
+    def test_scanline_flood_fill_outside_image(self):
+        """Test that a seed outside the image leaves it untouched."""
+        image = _random_image(7, (8, 8))
+        expected = image.tobytes()
+        fill_tool._scanline_flood_fill(image, 8, 3, FILL_COLOR, 0)
+        fill_tool._scanline_flood_fill(image, -1, 3, FILL_COLOR, 0)
+        assert image.tobytes() == expected
+
+    @pytest.mark.parametrize("seed, tolerance", [(0, 0), (1, 5), (2, 50), (3, 100)])
+    def test_non_contiguous_fill_matches_pixel_loop(self, monkeypatch, seed, tolerance):
+        """Test that the NumPy non-contiguous fill matches the per-pixel loop."""
+        tool = fill_tool.FillTool()
+        image = _random_image(seed, (20, 15))
+        expected = image.copy()
+
+        monkeypatch.setattr(fill_tool, "HAS_NUMPY", False)
+        tool._non_contiguous_fill(expected, 4, 6, FILL_COLOR, tolerance)
+        monkeypatch.setattr(fill_tool, "HAS_NUMPY", True)
+        tool._non_contiguous_fill(image, 4, 6, FILL_COLOR, tolerance)
+
+        assert image.tobytes() == expected.tobytes()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -5,10 +5,16 @@ This module tests all image processing functions to ensure consistency
 between CLI and GUI operations.
 """
 
+import random
+
 import pytest
-from PIL import Image
+from PIL import Image, ImageEnhance
 
 from gui_image_studio.core.image_effects import (
+    _apply_contrast_brightness,
+    _is_identity,
+    _snap_angle,
+    _transform_steps,
     add_border,
     apply_blur,
     apply_brightness,
@@ -39,6 +45,14 @@ def sample_rgb_image():
     return Image.new("RGB", (100, 100), color=(255, 0, 0))
 
 
+def _noise_image(mode, size=(32, 32), seed=0):
+    """Create an image of seeded random pixels covering every band value."""
+    rng = random.Random(seed)
+    bands = len(mode)
+    data = bytes(rng.randrange(256) for _ in range(size[0] * size[1] * bands))
+    return Image.frombytes(mode, size, data)
+
+
 class TestResize:
     """Test image resizing functionality."""
 
@@ -121,6 +135,32 @@ class TestColorTransformations:
         with pytest.raises(ValueError):
             apply_brightness(sample_image, -1.0)
 
+    @pytest.mark.parametrize("mode", ["RGBA", "RGB", "L", "LA"])
+    @pytest.mark.parametrize("factor", [0.0, 0.5, 0.93, 1.0, 1.37, 2.0])
+    def test_contrast_matches_image_enhance(self, mode, factor):
+        """Test that contrast gives exactly ImageEnhance.Contrast's output."""
+        image = _noise_image(mode)
+        expected = ImageEnhance.Contrast(image).enhance(factor)
+        assert apply_contrast(image, factor).tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("mode", ["RGBA", "RGB", "L", "LA"])
+    @pytest.mark.parametrize("factor", [0.0, 0.5, 0.93, 1.0, 1.37, 2.0])
+    def test_brightness_matches_image_enhance(self, mode, factor):
+        """Test that brightness gives exactly ImageEnhance.Brightness's output."""
+        image = _noise_image(mode)
+        expected = ImageEnhance.Brightness(image).enhance(factor)
+        assert apply_brightness(image, factor).tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("mode", ["RGBA", "RGB"])
+    @pytest.mark.parametrize("contrast, brightness", [(0.6, 1.4), (1.8, 0.7)])
+    def test_contrast_brightness_single_pass(self, mode, contrast, brightness):
+        """Test that the combined table equals contrast then brightness."""
+        image = _noise_image(mode, seed=1)
+        expected = ImageEnhance.Contrast(image).enhance(contrast)
+        expected = ImageEnhance.Brightness(expected).enhance(brightness)
+        result = _apply_contrast_brightness(image, contrast, brightness)
+        assert result.tobytes() == expected.tobytes()
+
     def test_tint_application(self, sample_image):
         """Test color tinting."""
         # Apply blue tint
@@ -139,6 +179,20 @@ class TestColorTransformations:
         with pytest.raises(ValueError):
             apply_tint(sample_image, (0, 0, 255), 1.1)
 
+    @pytest.mark.parametrize("mode", ["RGBA", "RGB", "L"])
+    @pytest.mark.parametrize(
+        "tint_color, intensity",
+        [((0, 0, 255), 0.3), ((255, 128, 0), 0.77), ((12, 200, 90), 1.0)],
+    )
+    def test_tint_matches_overlay_blend(self, mode, tint_color, intensity):
+        """Test that the tint table equals blending with a solid overlay."""
+        image = _noise_image(mode, seed=2)
+        rgba = image.convert("RGBA")
+        overlay = Image.new("RGBA", rgba.size, tint_color + (255,))
+        expected = Image.blend(rgba, overlay, intensity)
+        result = apply_tint(image, tint_color, intensity)
+        assert result.tobytes() == expected.tobytes()
+
 
 class TestGeometricTransformations:
     """Test geometric transformations."""
@@ -268,6 +322,26 @@ class TestCompositeTransformations:
         assert result.size == sample_image.size
         assert result.mode == "RGBA"
 
+    @pytest.mark.parametrize("angle", [90, 450, -90, 360, 45])
+    def test_apply_transformations_rotation_matches_apply_rotation(self, angle):
+        """Test that composite rotation equals rotating directly."""
+        image = _noise_image("RGBA", size=(30, 20), seed=3)
+        expected = apply_rotation(image, angle)
+        result = apply_transformations(image, rotate=angle)
+        assert result.size == expected.size
+        assert result.tobytes() == expected.tobytes()
+
+    def test_apply_transformations_list_size(self, sample_image):
+        """Test that an unhashable list size bypasses the step cache."""
+        expected = apply_transformations(sample_image, size=(50, 40), grayscale=True)
+        result = apply_transformations(sample_image, size=[50, 40], grayscale=True)
+        assert result.tobytes() == expected.tobytes()
+
+    def test_transform_steps_cached(self):
+        """Test that the same parameters reuse one prebuilt step list."""
+        params = (True, 0, 1.0, (10, 10), 1.5, 1.0, 1.0, 1.0, 0.0, None, 0.0, None)
+        assert _transform_steps(*params) is _transform_steps(*params)
+
     def test_apply_transformations_no_changes(self, sample_image):
         """Test transformations with default values (no changes)."""
         result = apply_transformations(sample_image)
@@ -277,6 +351,46 @@ class TestCompositeTransformations:
         assert result.mode == sample_image.mode
 
 
+class TestIdentityTolerances:
+    """Test that near-identity parameters are skipped or snapped."""
+
+    @pytest.mark.parametrize(
+        "angle, expected",
+        [
+            (89.97, 90),
+            (-90.02, -90),
+            (450.01, 450),
+            (359.99, 360),
+            (45, 45),
+            (89.9, 89.9),
+        ],
+    )
+    def test_snap_angle(self, angle, expected):
+        """Test that only angles within tolerance snap to a quarter turn."""
+        assert _snap_angle(angle) == expected
+
+    @pytest.mark.parametrize(
+        "factor, expected", [(1.0, True), (1.0005, True), (0.9995, True), (1.01, False)]
+    )
+    def test_is_identity(self, factor, expected):
+        """Test the enhancement factor tolerance."""
+        assert _is_identity(factor) is expected
+
+    def test_near_identity_factors_leave_image_unchanged(self):
+        """Test that factors within tolerance skip their enhancement."""
+        image = _noise_image("RGBA", seed=4)
+        result = apply_transformations(
+            image, contrast=1.0004, brightness=0.9996, blur_radius=0.01
+        )
+        assert result.tobytes() == image.tobytes()
+
+    def test_near_quarter_rotation_transposes(self):
+        """Test that a near-quarter rotation gives the exact quarter turn."""
+        image = _noise_image("RGBA", size=(30, 20), seed=5)
+        result = apply_transformations(image, rotate=89.98)
+        assert result.tobytes() == apply_rotation(image, 90).tobytes()
+
+
 class TestConvenienceFunctions:
     """Test convenience functions."""
 
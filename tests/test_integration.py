@@ -12,7 +12,10 @@ from unittest.mock import patch
 import pytest
 from PIL import Image
 
-from gui_image_studio.core.image_effects import apply_transformations
+from gui_image_studio.core.image_effects import (
+    apply_transformations,
+    create_thumbnail,
+)
 from gui_image_studio.core.io_utils import load_image, save_image
 from gui_image_studio.image_loader import _apply_image_transformations
 from gui_image_studio.image_studio.core.image_manager import ImageManager
@@ -293,6 +296,50 @@ class TestBackwardCompatibility:
         preview = manager.get_preview("test")
         assert preview is not None
 
+    def test_image_manager_preview_after_drawing(self):
+        """Test that update_preview picks up drawing done in place."""
+        manager = ImageManager()
+        image = Image.new("RGBA", (100, 100), (255, 255, 255, 255))
+        manager.add_image("test", image)
+        manager.get_preview("test")
+
+        image.paste((255, 0, 0, 255), (0, 0, 100, 100))
+        manager.update_preview("test")
+        preview = manager.get_preview("test")
+        if isinstance(preview, Image.Image):
+            assert preview.getpixel((0, 0)) == (255, 0, 0, 255)
+        else:
+            assert preview is not None
+
+    def test_image_manager_preview_built_once(self, sample_image):
+        """Test that several transformations share one preview rebuild."""
+        manager = ImageManager()
+        manager.add_image("test", sample_image.copy())
+
+        with patch(
+            "gui_image_studio.image_studio.core.image_manager.create_thumbnail",
+            wraps=create_thumbnail,
+        ) as thumbnail:
+            manager.apply_transformations_to_image("test", grayscale=True)
+            manager.apply_transformations_to_image("test", brightness=1.5)
+            manager.apply_transformations_to_image("test", rotate=90)
+            preview = manager.get_preview("test")
+
+        assert thumbnail.call_count == 1
+        assert manager.image_previews["test"] is preview
+        if isinstance(preview, Image.Image):
+            expected = create_thumbnail(manager.get_image("test"), (64, 64))
+            assert preview.tobytes() == expected.tobytes()
+
+    def test_image_manager_reset_after_drawing(self, sample_image):
+        """Test that drawing on the current image leaves the original intact."""
+        manager = ImageManager()
+        manager.add_image("test", sample_image.copy())
+
+        manager.get_image("test").putpixel((0, 0), (1, 2, 3, 255))
+        manager.reset_image("test")
+        assert manager.get_image("test").tobytes() == sample_image.tobytes()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])